@@ -7,8 +7,18 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "requests>=2.31.0",
-        "pathlib>=1.0.1",
+        "python-dotenv>=1.0.0",
+        "pandas>=2.2.0",
     ],
+    extras_require={
+        "async": ["httpx[http2]>=0.27.0"],
+        "fast": ["orjson>=3.9.0"],
+        "crypto": ["cryptography>=41.0.0"],
+        "brotli": ["brotli>=1.0.9"],
+        "cache": ["requests-cache>=1.0.0"],
+        "polars": ["polars>=0.20.0"],
+        "stream": ["ijson>=3.1", "requests-toolbelt>=1.0.0"],
+    },
     author="Visual Layer",
     author_email="support@visuallayer.com",
     description="Python SDK for Visual Layer API",
@@ -20,5 +30,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.9",
 )
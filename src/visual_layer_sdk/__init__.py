@@ -4,9 +4,10 @@ Visual Layer SDK
 A Python SDK for interacting with the Visual Layer API.
 """
 
+from .async_client import AsyncVisualLayerClient
 from .client import VisualLayerClient
 from .dataset import Dataset
 from .exceptions import VisualLayerException
 
 __version__ = "0.1.5"
-__all__ = ["VisualLayerClient", "Dataset", "VisualLayerException"]
+__all__ = ["VisualLayerClient", "AsyncVisualLayerClient", "Dataset", "VisualLayerException"]
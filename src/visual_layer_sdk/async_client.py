@@ -0,0 +1,226 @@
+import asyncio
+import importlib.util
+
+try:
+    import httpx
+except ImportError:  # httpx is an optional dependency
+    httpx = None
+
+from .client import STATIC_HEADERS, VisualLayerClient
+from .json_utils import dumps, response_json
+from .logger import get_logger
+
+# Connection limits for the shared HTTP/2 connection pool
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+DEFAULT_TIMEOUT = 10.0
+
+# Upper bound on in-flight requests for a single fan-out call
+MAX_CONCURRENCY = 32
+# Statuses that mean the server is overloaded; the fan-out shrinks its concurrency and retries
+OVERLOAD_STATUSES = (429, 503)
+OVERLOAD_RETRIES = 3
+OVERLOAD_BACKOFF_SECONDS = 0.5
+
+# Dataset statuses at which wait_ready stops polling
+READY_STATUSES = ("READY", "completed")
+FINAL_STATUSES = READY_STATUSES + ("ERROR",)
+
+
+class _AdaptiveLimiter:
+    """
+    AIMD concurrency limiter for fan-out calls.
+
+    The window grows by roughly one slot per window of successful calls and halves
+    whenever the server reports overload, so concurrency settles near what the
+    server can actually sustain instead of a hand-tuned constant.
+    """
+
+    def __init__(self, max_limit: int, initial_limit: int = 4):
+        self.max_limit = max_limit
+        self.limit = float(min(initial_limit, max_limit))
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, overloaded: bool = False):
+        async with self._condition:
+            self.in_flight -= 1
+            if overloaded:
+                self.limit = max(1.0, self.limit / 2)
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class AsyncVisualLayerClient:
+    """
+    Asynchronous client for fanning out independent API calls.
+
+    Requests are sent through a single ``httpx.AsyncClient`` with HTTP/2 enabled, so
+    concurrent calls against the API ride as separate streams on one TLS connection
+    instead of queuing behind each other.
+
+    Requires the optional ``async`` extra: ``pip install "visual-layer-sdk[async]"``
+    """
+
+    def __init__(self, api_key: str, api_secret: str, http2: bool = True):
+        if httpx is None:
+            raise ImportError('AsyncVisualLayerClient requires httpx. Install it with: pip install "visual-layer-sdk[async]"')
+
+        if http2 and importlib.util.find_spec("h2") is None:
+            # httpx needs the h2 package for HTTP/2; fall back to HTTP/1.1 keep-alive instead of failing
+            get_logger().warning('HTTP/2 support is not installed, falling back to HTTP/1.1. Install it with: pip install "httpx[http2]"')
+            http2 = False
+        self.http2 = http2
+
+        # The sync client owns JWT generation and caching; its session is never used here
+        self._auth_client = VisualLayerClient(api_key, api_secret)
+        self.base_url = self._auth_client.base_url
+        self.logger = get_logger()
+        self._http = httpx.AsyncClient(
+            http2=http2,
+            headers=STATIC_HEADERS,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        await self._http.aclose()
+        self._auth_client.close()
+
+    async def _get(self, url: str, params: dict = None):
+        self.logger.request_details(url, "GET")
+        response = await self._http.get(url, params=params, headers=self._auth_client._get_headers())
+        self.logger.request_success(response.status_code)
+        response.raise_for_status()
+        return response_json(response)
+
+    async def get_details(self, dataset_id: str) -> dict:
+        """Get the raw details for a dataset"""
+        return await self._get(f"{self.base_url}/dataset/{dataset_id}")
+
+    async def get_stats(self, dataset_id: str) -> dict:
+        """Get statistics for a dataset"""
+        return await self._get(f"{self.base_url}/dataset/{dataset_id}/stats")
+
+    async def explore(self, dataset_id: str) -> dict:
+        """Get the raw explore response for a dataset"""
+        return await self._get(f"{self.base_url}/explore/{dataset_id}")
+
+    async def get_similarity_cluster(self, dataset_id: str, cluster_id: str, labels: list = None, page_number: int = 0) -> dict:
+        """Get one page of the verbose similarity cluster response for a dataset"""
+        return await self._get_similarity_cluster(dataset_id, cluster_id, dumps(labels) if labels else None, page_number)
+
+    async def _get_similarity_cluster(self, dataset_id: str, cluster_id: str, labels_param: str = None, page_number: int = 0) -> dict:
+        params = {"verbose": "true", "page_number": page_number}
+        if labels_param:
+            params["labels"] = labels_param
+        return await self._get(f"{self.base_url}/explore/{dataset_id}/similarity_cluster/{cluster_id}", params=params)
+
+    async def get_similarity_clusters(self, dataset_id: str, cluster_ids: list, labels: list = None, max_concurrency: int = MAX_CONCURRENCY) -> list:
+        """
+        Fetch the first page of several similarity clusters concurrently.
+
+        Concurrency adapts to the server: it ramps up while calls succeed and halves on
+        429/503 responses, which are retried with exponential backoff.
+
+        Args:
+            dataset_id (str): ID of the dataset
+            cluster_ids (list): IDs of the clusters to fetch
+            labels (list, optional): Labels to filter the cluster previews by
+            max_concurrency (int): Upper bound on requests in flight at once (default: 32)
+
+        Returns:
+            list: Cluster responses in the same order as ``cluster_ids``
+        """
+        limiter = _AdaptiveLimiter(max_concurrency)
+        # The label filter is the same for every cluster, so encode it once for the whole fan-out
+        labels_param = dumps(labels) if labels else None
+
+        async def fetch(cluster_id):
+            for attempt in range(OVERLOAD_RETRIES + 1):
+                await limiter.acquire()
+                overloaded = False
+                try:
+                    return await self._get_similarity_cluster(dataset_id, cluster_id, labels_param)
+                except httpx.HTTPStatusError as e:
+                    overloaded = e.response.status_code in OVERLOAD_STATUSES
+                    if not overloaded or attempt == OVERLOAD_RETRIES:
+                        raise
+                finally:
+                    await limiter.release(overloaded)
+                self.logger.debug("Cluster %s hit overload, concurrency limit now %d", cluster_id, limiter.limit)
+                await asyncio.sleep(OVERLOAD_BACKOFF_SECONDS * 2**attempt)
+
+        return await asyncio.gather(*[fetch(cluster_id) for cluster_id in cluster_ids])
+
+    async def fetch_dataset(self, dataset_id: str) -> dict:
+        """
+        Fetch details, stats and explore data for a dataset concurrently.
+
+        Args:
+            dataset_id (str): ID of the dataset
+
+        Returns:
+            dict: Mapping with "details", "stats" and "explore" responses
+        """
+        details, stats, explore = await asyncio.gather(
+            self.get_details(dataset_id),
+            self.get_stats(dataset_id),
+            self.explore(dataset_id),
+        )
+        return {"details": details, "stats": stats, "explore": explore}
+
+    async def get_datasets_bulk(self, dataset_ids: list) -> list:
+        """
+        Fetch the details of many datasets concurrently.
+
+        Args:
+            dataset_ids (list): IDs of the datasets to fetch
+
+        Returns:
+            list: Details dict for each dataset, in the same order as ``dataset_ids``
+        """
+        return await asyncio.gather(*[self.get_details(dataset_id) for dataset_id in dataset_ids])
+
+    async def get_status(self, dataset_id: str) -> str:
+        """Get the current status of a dataset"""
+        return (await self.get_details(dataset_id))["status"]
+
+    async def _poll_one(self, dataset_id: str, interval: float) -> str:
+        while True:
+            status = await self.get_status(dataset_id)
+            if status in FINAL_STATUSES:
+                return status
+            self.logger.debug("Dataset %s is %s, polling again in %ss", dataset_id, status, interval)
+            await asyncio.sleep(interval)
+
+    async def wait_ready(self, dataset_ids: list, interval: float = 2.0, timeout: float = None) -> dict:
+        """
+        Poll several datasets concurrently until each is ready or has failed.
+
+        Args:
+            dataset_ids (list): IDs of the datasets to wait for
+            interval (float): Seconds between polls of a single dataset (default: 2.0)
+            timeout (float, optional): Give up after this many seconds
+
+        Returns:
+            dict: Final status for each dataset ID
+
+        Raises:
+            asyncio.TimeoutError: If the datasets are not all finished within ``timeout``
+        """
+        statuses = await asyncio.wait_for(asyncio.gather(*[self._poll_one(dataset_id, interval) for dataset_id in dataset_ids]), timeout)
+        return dict(zip(dataset_ids, statuses))
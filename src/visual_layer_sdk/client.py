@@ -1,168 +1,540 @@
+import base64
+import hmac
+import json
 import os
-from datetime import datetime, timedelta, timezone
+import random
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from functools import partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+from urllib.parse import quote_plus, urlencode
 
-import jwt
-import pandas as pd
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
+
+try:
+    import ijson
+except ImportError:  # ijson is an optional dependency
+    ijson = None
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache is an optional dependency
+    requests_cache = None
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:  # requests-toolbelt is an optional dependency
+    MultipartEncoder = None
 
 from .dataset import Dataset
+from .json_utils import response_json
 from .logger import get_logger
 
+# pandas is imported inside the methods that build DataFrames so importing the SDK stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+# Lifetime of each generated JWT
+JWT_LIFETIME_SECONDS = 600
+# Regenerate the JWT this many seconds before it actually expires
+JWT_EXPIRY_MARGIN_SECONDS = 30
+# Constant JWT parts; only the key id and the timestamps vary
+JWT_HEADER = {"alg": "HS256", "typ": "JWT"}
+JWT_ISSUER = "sdk"
+
+# Headers sent with every request; only Authorization (and Content-Type for form posts) vary per call
+STATIC_HEADERS = {"accept": "application/json", "Content-Type": "application/json"}
+
+# Connection pool sizing for the shared session
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+# Default (connect, read) timeout applied to every request that doesn't set its own
+DEFAULT_TIMEOUT = (5, 30)
+# Large zip uploads legitimately take minutes
+UPLOAD_TIMEOUT = (5, 600)
+
+# Transient failures are retried inside the pooled connection with exponential backoff
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+# POST is left out on purpose: retrying dataset creation could create duplicates
+RETRY_ALLOWED_METHODS = frozenset(["GET", "DELETE"])
+# Never sleep longer than this when the server says the rate limit window is exhausted
+MAX_RATE_LIMIT_WAIT_SECONDS = 60
+
+# Output buffer size for the CSV written by main()
+CSV_WRITE_BUFFER_BYTES = 1 << 20
+
+# Fields kept from dataset records returned by the listing and details endpoints
+_SELECTED_FIELDS = (
+    "id",
+    "created_by",
+    "source_dataset_id",
+    "owned_by",
+    "display_name",
+    "description",
+    "preview_uri",
+    "source_type",
+    "source_uri",
+    "created_at",
+    "updated_at",
+    "filename",
+    "sample",
+    "status",
+    "n_images",
+)
+
+# Dataset creation form fields that are always empty, encoded once
+_STATIC_FORM = urlencode({"vl_dataset_id": "", "config_url": ""})
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as required for JWT segments"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _dataset_form_body(dataset_name: str, bucket_path: str = "", uploaded_filename: str = "", pipeline_type: str = None) -> str:
+    """Build the urlencoded dataset creation form, appending only the fields that vary per call"""
+    fields = (("dataset_name", dataset_name), ("bucket_path", bucket_path), ("uploaded_filename", uploaded_filename), ("pipeline_type", pipeline_type or ""))
+    return "&".join([_STATIC_FORM, *(f"{key}={quote_plus(value)}" for key, value in fields)])
+
+
+@contextmanager
+def _dataset_creation_errors():
+    """Surface the API's error message, and a clearer timeout message, for dataset creation failures"""
+    try:
+        yield
+    except requests.exceptions.Timeout:
+        raise requests.exceptions.RequestException("Request timed out - dataset processing may take longer than expected")
+    except requests.exceptions.RequestException as e:
+        if getattr(e, "response", None) is not None:
+            try:
+                error_data = response_json(e.response)
+                raise requests.exceptions.RequestException(error_data.get("message", str(e)))
+            except ValueError:
+                pass
+        raise
+
+
+def _load_signing_key(pem: str):
+    """Load a PEM private key once and return its JWS algorithm name and a signing function"""
+    try:
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+        from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+    except ImportError:
+        raise ImportError('PEM API secrets require the cryptography package. Install it with: pip install "visual-layer-sdk[crypto]"')
+
+    key = serialization.load_pem_private_key(pem.encode(), password=None)
+    if isinstance(key, ed25519.Ed25519PrivateKey):
+        return "EdDSA", key.sign
+    if isinstance(key, ec.EllipticCurvePrivateKey) and isinstance(key.curve, ec.SECP256R1):
+
+        def sign_es256(data: bytes) -> bytes:
+            # JWS wants the raw r || s pair rather than the DER encoding cryptography returns
+            r, s = decode_dss_signature(key.sign(data, ec.ECDSA(hashes.SHA256())))
+            return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+        return "ES256", sign_es256
+    raise ValueError("Unsupported PEM key: only Ed25519 (EdDSA) and P-256 (ES256) private keys are supported")
+
+
+class _JitteredRetry(Retry):
+    """Retry policy that applies full jitter to urllib3's exponential backoff"""
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+
+def _throttle_on_rate_limit(response, *args, **kwargs):
+    """Response hook that waits out an exhausted rate limit window before the next request can 429"""
+    # Cache hits replay old rate limit headers without a request going out, and CachedSession dispatches
+    # response hooks a second time on top of requests.Session, so only act once per network response
+    if getattr(response, "from_cache", False) or getattr(response, "_rate_limit_checked", False):
+        return
+    response._rate_limit_checked = True
+    if response.headers.get("X-RateLimit-Remaining") != "0":
+        return
+    try:
+        reset = float(response.headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return
+    # The reset header is either an epoch timestamp or a number of seconds from now
+    delay = reset - time.time() if reset > 1e9 else reset
+    if delay > 0:
+        time.sleep(min(delay, MAX_RATE_LIMIT_WAIT_SECONDS))
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout so a stalled server can't hold a pooled connection forever"""
+
+    def __init__(self, *args, timeout=DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+
+class _JWTAuth(AuthBase):
+    """Session auth that attaches the cached JWT to API requests only, never to presigned download URLs"""
+
+    def __init__(self, client: "VisualLayerClient"):
+        self.client = client
+
+    def __call__(self, request):
+        if request.url.startswith(self.client.base_url):
+            request.headers.update(self.client._get_headers())
+        return request
+
 
 class VisualLayerClient:
-    def __init__(self, api_key: str, api_secret: str):
+    def __init__(self, api_key: str, api_secret: str, pool_maxsize: int = POOL_MAXSIZE, proxies: dict = None, timeout=DEFAULT_TIMEOUT, cache_ttl: int = 0, verify=None):
         self.base_url = "https://app.visual-layer.com/api/v1"
+        # Endpoint URLs are built once here rather than formatted on every call
+        self._url_datasets = f"{self.base_url}/datasets"
+        self._url_dataset = f"{self.base_url}/dataset"
+        self._url_healthcheck = f"{self.base_url}/healthcheck"
+        self._url_sample_datasets = f"{self.base_url}/datasets/sample_data"
         self.api_key = api_key
         self.api_secret = api_secret
-        self.session = requests.Session()
+        self.cache_ttl = cache_ttl
+        if cache_ttl:
+            if requests_cache is None:
+                raise ImportError('Response caching requires requests-cache. Install it with: pip install "visual-layer-sdk[cache]"')
+            # Only the dataset listing and details are cached; exports, status polling and stats must stay live and streamable.
+            # The first matching pattern wins, so the exclusions come before the broader /dataset/ pattern.
+            urls_expire_after = {
+                f"{self._url_dataset}/*/export": requests_cache.DO_NOT_CACHE,
+                f"{self._url_dataset}/*/stats": requests_cache.DO_NOT_CACHE,
+                f"{self._url_dataset}/*": cache_ttl,
+                self._url_datasets: cache_ttl,
+                "*": requests_cache.DO_NOT_CACHE,
+            }
+            # Kept in memory so cached responses are never shared between clients with different credentials
+            self.session = requests_cache.CachedSession(backend="memory", urls_expire_after=urls_expire_after, allowable_methods=("GET",), cache_control=True)
+        else:
+            self.session = requests.Session()
+        # Skip the per-request proxy/netrc/CA-bundle environment lookups; proxies are configured explicitly instead
+        self.session.trust_env = False
+        if proxies:
+            self.session.proxies.update(proxies)
+        # Read the CA bundle variables requests would have honoured once here, so TLS-intercepting proxies keep working
+        if verify is None:
+            verify = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or True
+        self.session.verify = verify
+        # Static headers live on the session; the Authorization header is added by the session auth
+        self.session.headers.update(STATIC_HEADERS)
+        self.session.auth = _JWTAuth(self)
+        retry = _JitteredRetry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            allowed_methods=RETRY_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            # Hand the last response back so raise_for_status() reports the real HTTP error
+            raise_on_status=False,
+        )
+        # Keep enough pooled keep-alive connections around that bursts of calls reuse existing TLS sockets
+        adapter = _TimeoutHTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_maxsize, max_retries=retry, timeout=timeout)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.hooks["response"].append(_throttle_on_rate_limit)
         self.logger = get_logger()
+        self._jwt_token = None
+        self._jwt_exp = 0
+        self._auth_headers = MappingProxyType({})
+        # Serialises token refreshes so concurrent threads don't all re-sign at expiry
+        self._jwt_lock = threading.Lock()
+        # The JWT header and signing key never change, so encode/load them once
+        if api_secret.startswith("-----BEGIN"):
+            algorithm, self._jwt_sign = _load_signing_key(api_secret)
+        else:
+            algorithm, self._jwt_sign = "HS256", partial(hmac.digest, api_secret.encode(), digest="sha256")
+        self._jwt_header_b64 = _b64url(json.dumps({**JWT_HEADER, "alg": algorithm, "kid": api_key}, separators=(",", ":")).encode())
+        self._jwt_payload_base = {"sub": api_key, "iss": JWT_ISSUER}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the session and release its pooled connections"""
+        self.session.close()
 
     def _generate_jwt(self) -> str:
-        jwt_algorithm = "HS256"
-        jwt_header = {
-            "alg": jwt_algorithm,
-            "typ": "JWT",
-            "kid": self.api_key,
-        }
-
-        now = datetime.now(tz=timezone.utc)
-        expiration = now + timedelta(minutes=10)
-
-        payload = {
-            "sub": self.api_key,
-            "iat": int(now.timestamp()),
-            "exp": int(expiration.timestamp()),
-            "iss": "sdk",
-        }
-
-        return jwt.encode(
-            payload=payload,
-            key=self.api_secret,
-            algorithm=jwt_algorithm,
-            headers=jwt_header,
-        )
-
-    def _get_headers(self) -> dict:
-        return {
-            "Authorization": f"Bearer {self._generate_jwt()}",
-            "accept": "application/json",
-            "Content-Type": "application/json",
-        }
-
-    def _get_headers_no_jwt(self) -> dict:
-        return {"accept": "application/json", "Content-Type": "application/json"}
+        # Tokens are valid for 10 minutes, so reuse the cached one until shortly before it expires
+        if self._jwt_token and time.time() < self._jwt_exp - JWT_EXPIRY_MARGIN_SECONDS:
+            return self._jwt_token
+
+        with self._jwt_lock:
+            # Another thread may have refreshed the token while we waited for the lock
+            if self._jwt_token and time.time() < self._jwt_exp - JWT_EXPIRY_MARGIN_SECONDS:
+                return self._jwt_token
+            return self._sign_jwt()
+
+    def _sign_jwt(self) -> str:
+        now = int(time.time())
+        exp = now + JWT_LIFETIME_SECONDS
+        payload = {**self._jwt_payload_base, "iat": now, "exp": exp}
+
+        # Sign directly with the preloaded key instead of going through PyJWT's generic encode path
+        payload_b64 = _b64url(json.dumps(payload, separators=(",", ":")).encode())
+        signing_input = self._jwt_header_b64 + b"." + payload_b64
+        signature = self._jwt_sign(signing_input)
+        self._jwt_token = (signing_input + b"." + _b64url(signature)).decode()
+        # Read-only so the shared headers mapping can be handed to every request while the token is fresh
+        self._auth_headers = MappingProxyType({"Authorization": f"Bearer {self._jwt_token}"})
+        self._jwt_exp = exp
+        return self._jwt_token
+
+    def _get_headers(self) -> MappingProxyType:
+        self._generate_jwt()
+        return self._auth_headers
+
+    def _get_json(self, url: str, refresh: bool = False, **kwargs):
+        """GET an API URL over the shared session and return the parsed JSON body, raising on HTTP errors"""
+        if refresh and self.cache_ttl:
+            # Skip the response cache lookup (the fresh response still replaces the cached one)
+            kwargs["force_refresh"] = True
+        response = self.session.get(url, **kwargs)
+        # Only pay for raise_for_status() on the error path; some endpoints are polled heavily
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return response_json(response)
 
     def get_sample_datasets(self) -> list:
         """Get sample datasets"""
-        url = f"{self.base_url}/datasets/sample_data"
-        headers = self._get_headers()
-
+        url = self._url_sample_datasets
         self.logger.request_details(url, "GET")
-        self.logger.debug(f"Headers: {headers}")
-        self.logger.debug(f"JWT Token: {self._generate_jwt()}")
 
         try:
             self.logger.info("Fetching sample datasets...")
-            response = self.session.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             self.logger.request_success(response.status_code)
-            self.logger.debug(f"Response Headers: {dict(response.headers)}")
-            self.logger.debug(f"Response Body: {response.text[:500]}...")
+            # Only copy the headers and decode the body when someone is going to see them
+            if self.logger.is_debug_enabled():
+                self.logger.debug(f"Response Headers: {dict(response.headers)}")
+                self.logger.debug(f"Response Body: {response.text[:500]}...")
 
             response.raise_for_status()
-            return response.json()
+            return response_json(response)
         except requests.exceptions.Timeout:
             self.logger.error("Request timed out after 10 seconds")
             raise
         except requests.exceptions.RequestException as e:
             self.logger.request_error(str(e))
-            if hasattr(e, "response"):
+            if getattr(e, "response", None) is not None and self.logger.is_debug_enabled():
                 self.logger.debug(f"Error response: {e.response.text}")
             raise
 
     def healthcheck(self) -> dict:
         """Check the health of the API"""
-        response = self.session.get(f"{self.base_url}/healthcheck", headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return self._get_json(self._url_healthcheck)
+
+    def iter_all_datasets(self, page_size: int = None) -> Iterator[dict]:
+        """
+        Iterate over all datasets as raw dicts without holding the whole listing in memory.
+
+        The response is parsed incrementally when the optional ``ijson`` package is installed,
+        so callers that stop early (e.g. with ``itertools.islice``) never read the rest of the body.
+        Without ``ijson`` the listing is parsed in one go and yielded item by item.
+
+        Args:
+            page_size (int, optional): Request the listing in pages of this many datasets using
+                ``limit``/``offset`` query parameters. If the server ignores them and returns more
+                than ``page_size`` items, that response is treated as the full listing.
+
+        Yields:
+            dict: One dataset record at a time
+
+        Raises:
+            ValueError: If ``page_size`` is less than 1
+        """
+        if page_size is None:
+            yield from self._iter_dataset_page()
+            return
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+
+        offset = 0
+        previous_first = None
+        while True:
+            count = 0
+            with closing(self._iter_dataset_page({"limit": page_size, "offset": offset})) as page:
+                for count, dataset in enumerate(page, 1):
+                    # A server that ignores limit/offset sends the same listing again; stop rather than re-yield it
+                    if count == 1 and offset and dataset == previous_first:
+                        return
+                    if count == 1:
+                        previous_first = dataset
+                    yield dataset
+            # A short page is the last one; an oversized page means the server returned everything at once
+            if count != page_size:
+                return
+            offset += page_size
+
+    def _iter_dataset_page(self, params: dict = None) -> Iterator[dict]:
+        with self.session.get(self._url_datasets, params=params, stream=True) as response:
+            response.raise_for_status()
+            # A cache hit hands back the same stored response each time, and its raw stream was drained by the first read
+            if ijson is None or getattr(response, "from_cache", False):
+                yield from response_json(response)
+                return
+
+            # Let urllib3 undo any gzip/deflate transfer encoding before ijson reads the stream
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "item", use_float=True)
+
+    def iter_datasets(self, page_size: int = None) -> Iterator[Dataset]:
+        """
+        Iterate over all datasets as Dataset objects, built lazily from the streamed listing.
+
+        Args:
+            page_size (int, optional): Fetch the listing in pages of this size (see ``iter_all_datasets``)
+
+        Yields:
+            Dataset: One Dataset object at a time
+        """
+        for dataset in self.iter_all_datasets(page_size=page_size):
+            yield Dataset(self, dataset["id"])
 
     # TODO: consider adding a limit to the number of datasets returned
-    def get_all_datasets(self) -> pd.DataFrame:
+    def get_all_datasets(self) -> "pd.DataFrame":
         """Get all datasets as a DataFrame"""
-        response = self.session.get(f"{self.base_url}/datasets", headers=self._get_headers())
-        response.raise_for_status()
-        datasets = response.json()
-
-        # Select only the specific fields for each dataset
-        selected_fields = [
-            "id",
-            "created_by",
-            "source_dataset_id",
-            "owned_by",
-            "display_name",
-            "description",
-            "preview_uri",
-            "source_type",
-            "source_uri",
-            "created_at",
-            "updated_at",
-            "filename",
-            "sample",
-            "status",
-            "n_images",
-        ]
-
-        # Filter each dataset to only include the selected fields
-        filtered_datasets = []
-        for dataset in datasets:
-            filtered_dataset = {field: dataset.get(field) for field in selected_fields}
-            filtered_datasets.append(filtered_dataset)
-
-        # Convert to DataFrame
-        df = pd.DataFrame(filtered_datasets)
-        return df
-
-    def get_dataset(self, dataset_id: str) -> pd.DataFrame:
+        import pandas as pd
+
+        datasets = self._get_json(self._url_datasets)
+
+        # Project onto the selected fields inside pandas instead of building a filtered dict per dataset
+        return pd.DataFrame(datasets).reindex(columns=list(_SELECTED_FIELDS))
+
+    def get_all_datasets_polars(self) -> "pl.DataFrame":
+        """
+        Get all datasets as a polars DataFrame.
+
+        Builds the same columns as ``get_all_datasets`` but goes through polars' columnar
+        constructor, which is faster and lighter than pandas for large listings.
+        Requires the optional ``polars`` extra: ``pip install "visual-layer-sdk[polars]"``
+        """
+        import polars as pl
+
+        datasets = self._get_json(self._url_datasets)
+        # Passing the field names as the schema drops other keys and fills missing ones with nulls
+        return pl.from_dicts(datasets, schema=list(_SELECTED_FIELDS), infer_schema_length=None)
+
+    def get_all_datasets_detailed(self, max_workers: int = 16) -> list:
+        """
+        Get the details of every dataset, fetching them concurrently over the pooled session.
+
+        Args:
+            max_workers (int): Maximum number of concurrent requests (default: 16)
+
+        Returns:
+            list: Details dict for each dataset, in listing order
+        """
+        return self.map(lambda dataset: dataset.get_details(), self.iter_datasets(), max_workers=max_workers)
+
+    def get_dataset(self, dataset_id: str) -> "pd.DataFrame":
         """Get dataset details as a DataFrame for the given ID"""
         return self.get_dataset_details_as_dataframe(dataset_id)
 
     # TODO: move to dataset.py
-    def get_dataset_details_as_dataframe(self, dataset_id: str) -> pd.DataFrame:
-        """Get dataset details as a DataFrame for the given ID"""
-        response = self.session.get(f"{self.base_url}/dataset/{dataset_id}", headers=self._get_headers())
-        response.raise_for_status()
-        dataset_details = response.json()
-
-        # Select only the specific fields requested
-        selected_fields = [
-            "id",
-            "created_by",
-            "source_dataset_id",
-            "owned_by",
-            "display_name",
-            "description",
-            "preview_uri",
-            "source_type",
-            "source_uri",
-            "created_at",
-            "updated_at",
-            "filename",
-            "sample",
-            "status",
-            "n_images",
-        ]
+    def get_dataset_details(self, dataset_id: str) -> dict:
+        """Get the selected dataset detail fields as a plain dict, without building a DataFrame"""
+        dataset_details = self._get_json(f"{self._url_dataset}/{dataset_id}")
 
         # Filter the dataset details to only include the selected fields
-        filtered_details = {field: dataset_details.get(field) for field in selected_fields}
+        return {field: dataset_details.get(field) for field in _SELECTED_FIELDS}
+
+    def get_dataset_details_as_dataframe(self, dataset_id: str) -> "pd.DataFrame":
+        """Get dataset details as a DataFrame for the given ID"""
+        import pandas as pd
 
         # Convert to DataFrame with a single row
-        df = pd.DataFrame([filtered_details])
-        return df
+        return pd.DataFrame([self.get_dataset_details(dataset_id)])
+
+    def get_datasets_bulk(self, dataset_ids: Iterable, max_workers: int = 16) -> "pd.DataFrame":
+        """
+        Get the details of many datasets concurrently as a single DataFrame.
+
+        Args:
+            dataset_ids (Iterable): IDs of the datasets to fetch
+            max_workers (int): Maximum number of concurrent requests (default: 16)
+
+        Returns:
+            pd.DataFrame: One row per dataset, in the same order as ``dataset_ids``
+        """
+        import pandas as pd
+
+        # Build one DataFrame from all the dicts instead of concatenating single-row frames
+        return pd.DataFrame(self.map(self.get_dataset_details, dataset_ids, max_workers=max_workers))
 
     def get_dataset_object(self, dataset_id: str) -> Dataset:
         """Get a dataset object for the given ID (for operations like export, delete, etc.)"""
         return Dataset(self, dataset_id)
 
+    def map(self, fn: Callable, items: Iterable, max_workers: int = 16) -> list:
+        """
+        Apply a function to many items concurrently over the shared session.
+
+        Calls are I/O bound, so running them on a thread pool overlaps the round-trips
+        while still reusing the pooled keep-alive connections.
+
+        Args:
+            fn (Callable): Function to call for each item, e.g. ``lambda ds: ds.get_stats()``
+            items (Iterable): Items to pass to ``fn``, such as Dataset objects or dataset IDs
+            max_workers (int): Maximum number of concurrent calls (default: 16)
+
+        Returns:
+            list: Results of ``fn`` in the same order as ``items``
+
+        Example:
+            datasets = [client.get_dataset_object(dataset_id) for dataset_id in dataset_ids]
+            stats = client.map(lambda dataset: dataset.get_stats(), datasets)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, items))
+
+    def _create_dataset(self, dataset_name: str, bucket_path: str = "", uploaded_filename: str = "", pipeline_type: str = None, timeout: float = None) -> str:
+        """POST the dataset creation form and return the new dataset's ID"""
+        url = self._url_dataset
+        form_data = _dataset_form_body(dataset_name, bucket_path=bucket_path, uploaded_filename=uploaded_filename, pipeline_type=pipeline_type)
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+        self.logger.request_details(url, "POST")
+        self.logger.debug("Form Data: %s", form_data)
+
+        response = self.session.post(url, data=form_data, headers=headers, timeout=timeout)
+
+        self.logger.request_success(response.status_code)
+        response.raise_for_status()
+        result = response_json(response)
+        # Log the already-parsed body rather than decoding response.text a second time
+        self.logger.debug("Response Body: %s", result)
+
+        if result.get("status") == "error":
+            raise requests.exceptions.RequestException(result.get("message", "Unknown error"))
+
+        dataset_id = result.get("id")
+        if not dataset_id:
+            raise requests.exceptions.RequestException("No dataset_id returned from creation")
+
+        self.logger.dataset_created(dataset_id, dataset_name)
+        return dataset_id
+
     # TODO: validate inputs
     def create_dataset_from_s3_bucket(self, s3_bucket_path: str, dataset_name: str, pipeline_type: str = None) -> Dataset:
         """
@@ -183,60 +555,11 @@ class VisualLayerClient:
         if not s3_bucket_path or not dataset_name:
             raise ValueError("Both s3_bucket_path and dataset_name are required")
 
-        url = f"{self.base_url}/dataset"
-
-        # Prepare form data with all required fields
-        form_data = {
-            "dataset_name": dataset_name,
-            "vl_dataset_id": "",
-            "bucket_path": s3_bucket_path,
-            "uploaded_filename": "",
-            "config_url": "",
-            "pipeline_type": pipeline_type if pipeline_type else "",
-        }
-
-        try:
-            headers = self._get_headers()
-            headers["Content-Type"] = "application/x-www-form-urlencoded"
-
-            self.logger.request_details(url, "POST")
-            self.logger.debug(f"Form Data: {form_data}")
-
-            self.logger.info(f"Creating dataset '{dataset_name}' from S3 bucket...")
-            response = self.session.post(
-                url,
-                data=form_data,  # Use data parameter for form data
-                headers=headers,
-                timeout=30,  # Increased timeout for processing
-            )
-
-            self.logger.request_success(response.status_code)
-            self.logger.debug(f"Response Body: {response.text}")
-
-            response.raise_for_status()
-            result = response.json()
-
-            if result.get("status") == "error":
-                raise requests.exceptions.RequestException(result.get("message", "Unknown error"))
-
-            # Extract dataset ID and return Dataset object
-            dataset_id = result.get("id")
-            if not dataset_id:
-                raise requests.exceptions.RequestException("No dataset_id returned from creation")
-
-            self.logger.dataset_created(dataset_id, dataset_name)
-            return Dataset(self, dataset_id)
-
-        except requests.exceptions.Timeout:
-            raise requests.exceptions.RequestException("Request timed out - dataset processing may take longer than expected")
-        except requests.exceptions.RequestException as e:
-            if hasattr(e, "response") and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    raise requests.exceptions.RequestException(error_data.get("message", str(e)))
-                except ValueError:
-                    pass
-            raise
+        self.logger.info(f"Creating dataset '{dataset_name}' from S3 bucket...")
+        with _dataset_creation_errors():
+            # Increased timeout for processing
+            dataset_id = self._create_dataset(dataset_name, bucket_path=s3_bucket_path, pipeline_type=pipeline_type, timeout=30)
+        return Dataset(self, dataset_id)
 
     def create_dataset_from_local_folder(
         self,
@@ -264,96 +587,101 @@ class VisualLayerClient:
         if not file_path or not filename or not dataset_name:
             raise ValueError("file_path, filename, and dataset_name are all required")
 
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Check the file exists and is a regular file with a single stat call
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
             raise ValueError(f"File not found: {file_path}")
-
-        # Step 1: Create the dataset
-        url = f"{self.base_url}/dataset"
-
-        # Prepare form data for dataset creation
-        form_data = {
-            "dataset_name": dataset_name,
-            "vl_dataset_id": "",
-            "bucket_path": "",
-            "uploaded_filename": filename,
-            "config_url": "",
-            "pipeline_type": pipeline_type if pipeline_type else "",
-        }
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise ValueError(f"Not a file: {file_path}")
 
         try:
-            headers = self._get_headers()
-            headers["Content-Type"] = "application/x-www-form-urlencoded"
-
-            self.logger.info(f"Creating dataset '{dataset_name}'...")
-            self.logger.request_details(url, "POST")
-            self.logger.debug(f"Form Data: {form_data}")
-
-            response = self.session.post(url, data=form_data, headers=headers)
-
-            self.logger.request_success(response.status_code)
-            response.raise_for_status()
-            result = response.json()
-
-            if result.get("status") == "error":
-                raise requests.exceptions.RequestException(result.get("message", "Unknown error"))
-
-            dataset_id = result.get("id")
-            if not dataset_id:
-                raise requests.exceptions.RequestException("No dataset_id returned from creation")
-
-            self.logger.dataset_created(dataset_id, dataset_name)
-
-            # Step 2: Upload the zip file to the dataset
-            upload_url = f"{self.base_url}/dataset/{dataset_id}/upload"
-
-            self.logger.dataset_uploading(dataset_name)
-            self.logger.request_details(upload_url, "POST")
-            self.logger.debug(f"File path: {file_path}")
-            self.logger.debug(f"Filename: {filename}")
-
-            # Prepare multipart form data for file upload
-            with open(file_path, "rb") as file:
-                files = {"file": (filename, file, "application/zip")}
-                data = {"operations": "READ"}
-
-                upload_headers = self._get_headers()
-                # Remove Content-Type header to let requests set it for multipart
-                upload_headers.pop("Content-Type", None)
-
-                upload_response = self.session.post(
-                    upload_url,
-                    files=files,
-                    data=data,
-                    headers=upload_headers,
-                )
-
-                self.logger.request_success(upload_response.status_code)
-                upload_response.raise_for_status()
-                upload_result = upload_response.json()
+            with _dataset_creation_errors():
+                # Step 1: Create the dataset
+                self.logger.info(f"Creating dataset '{dataset_name}'...")
+                dataset_id = self._create_dataset(dataset_name, uploaded_filename=filename, pipeline_type=pipeline_type)
+
+                # Step 2: Upload the zip file to the dataset
+                upload_url = f"{self._url_dataset}/{dataset_id}/upload"
+
+                self.logger.dataset_uploading(dataset_name)
+                self.logger.request_details(upload_url, "POST")
+                self.logger.debug("File path: %s", file_path)
+                self.logger.debug("Filename: %s (%s bytes)", filename, file_stat.st_size)
+
+                # Prepare multipart form data for file upload
+                with open(file_path, "rb") as file:
+                    if MultipartEncoder is not None:
+                        # Stream the zip from disk in chunks instead of building the whole multipart body in memory
+                        encoder = MultipartEncoder(fields={"file": (filename, file, "application/zip"), "operations": "READ"})
+                        upload_headers = {"Content-Type": encoder.content_type}
+                        upload_response = self.session.post(upload_url, data=encoder, headers=upload_headers, timeout=UPLOAD_TIMEOUT)
+                    else:
+                        files = {"file": (filename, file, "application/zip")}
+                        data = {"operations": "READ"}
+
+                        # Unset the session's JSON Content-Type to let requests set it for multipart
+                        upload_headers = {"Content-Type": None}
+
+                        upload_response = self.session.post(
+                            upload_url,
+                            files=files,
+                            data=data,
+                            headers=upload_headers,
+                            timeout=UPLOAD_TIMEOUT,
+                        )
+
+                    self.logger.request_success(upload_response.status_code)
+                    upload_response.raise_for_status()
 
                 self.logger.dataset_uploaded(dataset_name)
-
-                # Return Dataset object
                 return Dataset(self, dataset_id)
-                # TODO: return dataset object instead of dict
-        except requests.exceptions.Timeout:
-            raise requests.exceptions.RequestException("Request timed out - dataset processing may take longer than expected")
-        except requests.exceptions.RequestException as e:
-            if hasattr(e, "response") and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    raise requests.exceptions.RequestException(error_data.get("message", str(e)))
-                except ValueError:
-                    pass
+        except requests.exceptions.RequestException:
             raise
         except FileNotFoundError:
             raise ValueError(f"Zip file not found: {file_path}")
         except Exception as e:
             raise requests.exceptions.RequestException(f"Unexpected error: {str(e)}")
 
+    def create_datasets_from_local_folders(self, uploads: Iterable, pipeline_type: str = None, max_workers: int = 8) -> list:
+        """
+        Create several datasets from local zip files concurrently.
+
+        Args:
+            uploads (Iterable): ``(file_path, dataset_name)`` pairs; the upload filename is the file's basename
+            pipeline_type (str, optional): Type of pipeline to use for processing
+            max_workers (int): Maximum number of concurrent uploads (default: 8)
+
+        Returns:
+            list: One result per upload, in the same order as ``uploads``: the created Dataset, or
+                the exception raised for that upload. A failed upload doesn't stop the others, and the
+                datasets that were created are still returned.
+
+        Raises:
+            ValueError: If any file path or name is invalid, before anything is uploaded
+        """
+        uploads = list(uploads)
+        # Validate every file up front so a bad path doesn't fail the batch halfway through
+        for file_path, dataset_name in uploads:
+            if not file_path or not dataset_name:
+                raise ValueError("file_path and dataset_name are both required")
+            try:
+                file_stat = os.stat(file_path)
+            except FileNotFoundError:
+                raise ValueError(f"File not found: {file_path}")
+            if not stat.S_ISREG(file_stat.st_mode):
+                raise ValueError(f"Not a file: {file_path}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.create_dataset_from_local_folder, file_path, os.path.basename(file_path), dataset_name, pipeline_type) for file_path, dataset_name in uploads]
+        # Report every outcome rather than raising the first failure, which would lose the IDs of datasets already created
+        return [future.exception() or future.result() for future in futures]
+
 
 def main():
+    # Only the script entry point reads .env, so importing the SDK never touches the filesystem for it
+    from dotenv import load_dotenv
+
     load_dotenv()
 
     # Get API credentials from environment
@@ -365,31 +693,37 @@ def main():
         print("Please make sure VISUAL_LAYER_API_KEY and VISUAL_LAYER_API_SECRET are set in your .env file")
         return
 
-    print("🚀 Initializing Visual Layer client...")
-    client = VisualLayerClient(API_KEY, API_SECRET)
+    # Banners are only for people watching a terminal; skip them under CI or cron
+    interactive = sys.stdout.isatty()
 
-    # Only run the async label search test
-    print("\n" + "=" * 60)
-    print("TEST: Async Label Search and Download")
-    print("=" * 60)
+    if interactive:
+        print("🚀 Initializing Visual Layer client...")
+    with VisualLayerClient(API_KEY, API_SECRET) as client:
+        # Only run the async label search test
+        if interactive:
+            print("\n" + "=" * 60)
+            print("TEST: Async Label Search and Download")
+            print("=" * 60)
 
-    try:
-        test_dataset_id = "bc41491e-78ae-11ef-ba4b-8a774758b536"
-        test_labels = ["bean_rust", "angular_leaf_spot"]
-        client.logger.info(f"Testing async label search for dataset: {test_dataset_id} with labels: {test_labels}")
-        test_dataset = Dataset(client, test_dataset_id)
-        df = test_dataset.search_by_labels_async_to_dataframe(test_labels)
-        client.logger.success(f"Async label search DataFrame shape: {df.shape}")
-        print(df.head())
-
-        # Save DataFrame to CSV
-        csv_filename = "async_label_search_results.csv"
-        df.to_csv(csv_filename, index=False)
-        client.logger.success(f"DataFrame saved to {csv_filename}")
-        print(f"📄 Results saved to: {csv_filename}")
-
-    except Exception as e:
-        client.logger.error(f"Error in async label search and download: {str(e)}")
+        try:
+            test_dataset_id = "bc41491e-78ae-11ef-ba4b-8a774758b536"
+            test_labels = ["bean_rust", "angular_leaf_spot"]
+            client.logger.info(f"Testing async label search for dataset: {test_dataset_id} with labels: {test_labels}")
+            test_dataset = Dataset(client, test_dataset_id)
+            df = test_dataset.search_by_labels_async_to_dataframe(test_labels)
+            client.logger.success(f"Async label search DataFrame shape: {df.shape}")
+            print(df.head())
+
+            # Save DataFrame to CSV
+            csv_filename = "async_label_search_results.csv"
+            # Write through a 1 MiB buffer so large results go out in a few big writes
+            with open(csv_filename, "w", buffering=CSV_WRITE_BUFFER_BYTES, newline="") as f:
+                df.to_csv(f, index=False)
+            client.logger.success(f"DataFrame saved to {csv_filename}")
+            print(f"📄 Results saved to: {csv_filename}")
+
+        except Exception as e:
+            client.logger.error(f"Error in async label search and download: {str(e)}")
 
 
 if __name__ == "__main__":
@@ -1,67 +1,105 @@
-import pandas as pd
-import json
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List
+from uuid import UUID
 
+try:
+    import ijson
+except ImportError:  # ijson is an optional dependency
+    ijson = None
+
+from .json_utils import dumps, loads, response_json
 from .logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Fields kept from the dataset details response
+_DETAILS_FIELDS = (
+    "id",
+    "created_by",
+    "source_dataset_id",
+    "owned_by",
+    "display_name",
+    "description",
+    "preview_uri",
+    "source_type",
+    "source_uri",
+    "created_at",
+    "updated_at",
+    "filename",
+    "sample",
+    "status",
+)
+
+# Seconds a result cached by get_details() or fetch_all() is reused before it is fetched again
+CACHE_TTL_SECONDS = 5
+
 
 class Dataset:
+    __slots__ = ("client", "dataset_id", "logger", "_url", "_stats_url", "_explore_url", "_cache")
+
     # TODO: add id and name fields
     def __init__(self, client, dataset_id: str):
+        # Reject malformed IDs here rather than with a 404 from every request, and store the canonical form
+        if not isinstance(dataset_id, UUID):
+            try:
+                dataset_id = UUID(dataset_id)
+            except (TypeError, ValueError, AttributeError):
+                raise ValueError(f"Invalid dataset_id: {dataset_id!r} is not a valid UUID")
+        dataset_id = str(dataset_id)
+
         self.client = client
         self.dataset_id = dataset_id
-        self.base_url = client.base_url
         self.logger = get_logger()
 
+        # Build the per-dataset endpoint URLs once instead of formatting them on every call
+        base_url = client.base_url
+        self._url = f"{base_url}/dataset/{dataset_id}"
+        self._stats_url = self._url + "/stats"
+        self._explore_url = f"{base_url}/explore/{dataset_id}"
+        # field name -> (monotonic fetch time, result)
+        self._cache = {}
+
     def get_stats(self) -> dict:
         """Get statistics for this dataset"""
-        response = self.client.session.get(
-            f"{self.base_url}/dataset/{self.dataset_id}/stats",
-            headers=self.client._get_headers(),
-        )
-        response.raise_for_status()
-        return response.json()
-
-    def get_details(self) -> dict:
-        """Get details for this dataset"""
-        response = self.client.session.get(
-            f"{self.base_url}/dataset/{self.dataset_id}",
-            headers=self.client._get_headers(),
-        )
-        response.raise_for_status()
-        full_response = response.json()
-
-        # Filter to only include the specified fields
-        selected_fields = [
-            "id",
-            "created_by",
-            "source_dataset_id",
-            "owned_by",
-            "display_name",
-            "description",
-            "preview_uri",
-            "source_type",
-            "source_uri",
-            "created_at",
-            "updated_at",
-            "filename",
-            "sample",
-            "status",
-        ]
+        return self.client._get_json(self._stats_url)
+
+    def get_details(self, ttl: float = CACHE_TTL_SECONDS) -> dict:
+        """
+        Get details for this dataset.
+
+        Details are cached on this object for ``ttl`` seconds so that back-to-back calls
+        (e.g. get_status() followed by export()) only hit the API once.
+
+        Args:
+            ttl (float): Seconds a cached result is reused (default: 5). Pass 0 to always refetch.
+
+        Returns:
+            dict: Dataset details
+        """
+        cached = self._cache.get("details")
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        details = self._fetch_details()
+        self._cache["details"] = (time.monotonic(), details)
+        return details
+
+    def _fetch_details(self) -> dict:
+        """Fetch details for this dataset from the API, bypassing the cache"""
+        full_response = self.client._get_json(self._url, refresh=True)
 
         # Create filtered dictionary with only the selected fields
-        filtered_details = {field: full_response.get(field) for field in selected_fields}
+        filtered_details = {field: full_response.get(field) for field in _DETAILS_FIELDS}
 
         return filtered_details
 
-    def explore(self) -> pd.DataFrame:
+    def explore(self) -> "pd.DataFrame":
         """Explore this dataset and return previews as a DataFrame"""
-        response = self.client.session.get(
-            f"{self.base_url}/explore/{self.dataset_id}",
-            headers=self.client._get_headers(),
-        )
-        response.raise_for_status()
-        data = response.json()
+        import pandas as pd
+
+        data = self.client._get_json(self._explore_url)
 
         # Extract just the previews from the first cluster
         if data.get("clusters") and len(data["clusters"]) > 0:
@@ -72,7 +110,7 @@ class Dataset:
         else:
             return pd.DataFrame()  # Return empty DataFrame if no previews found
 
-    def search_by_captions(self, caption_text: str, similarity_threshold: float = 0.83) -> pd.DataFrame:
+    def search_by_captions(self, caption_text: str, similarity_threshold: float = 0.83) -> "pd.DataFrame":
         """
         Search dataset by AI-generated captions and return all images as a DataFrame.
 
@@ -83,6 +121,8 @@ class Dataset:
         Returns:
             pd.DataFrame: DataFrame containing all images from matching clusters
         """
+        import pandas as pd
+
         if not caption_text:
             return pd.DataFrame()
 
@@ -97,13 +137,7 @@ class Dataset:
                 "caption_only_filter": caption_text,
                 "page_number": page_number,
             }
-            response = self.client.session.get(
-                f"{self.base_url}/explore/{self.dataset_id}",
-                params=params,
-                headers=self.client._get_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self.client._get_json(self._explore_url, params=params)
             clusters = data.get("clusters", [])
             if not clusters:
                 break
@@ -126,13 +160,7 @@ class Dataset:
                     "caption_only_filter": caption_text,
                     "page_number": page_number,
                 }
-                cluster_response = self.client.session.get(
-                    f"{self.base_url}/explore/{self.dataset_id}/similarity_cluster/{cluster_id}",
-                    params=cluster_params,
-                    headers=self.client._get_headers(),
-                )
-                cluster_response.raise_for_status()
-                cluster_data = cluster_response.json()
+                cluster_data = self.client._get_json(f"{self._explore_url}/similarity_cluster/{cluster_id}", params=cluster_params)
                 if cluster_data is None:
                     break
                 previews = cluster_data.get("previews", [])
@@ -157,7 +185,7 @@ class Dataset:
         else:
             return pd.DataFrame()
 
-    def search_by_labels(self, labels: List[str]) -> pd.DataFrame:
+    def search_by_labels(self, labels: List[str]) -> "pd.DataFrame":
         """
         Search dataset by labels and return all images as a DataFrame.
 
@@ -167,22 +195,48 @@ class Dataset:
         Returns:
             pd.DataFrame: DataFrame containing all images from matching clusters
         """
+        import pandas as pd
+
         if not labels:
             return pd.DataFrame()
 
-        # --- Paginate cluster retrieval ---
+        labels_param = dumps(labels)
+        cluster_ids = self._get_label_cluster_ids(labels_param)
+        return self._label_previews_to_dataframe([(cluster_id, self._get_label_cluster_previews(cluster_id, labels_param)) for cluster_id in cluster_ids])
+
+    def search_by_labels_batched(self, labels: List[str], max_workers: int = 16) -> "pd.DataFrame":
+        """
+        Search dataset by labels, fetching the matching clusters concurrently.
+
+        Returns the same DataFrame as ``search_by_labels``, but after the cluster listing the
+        per-cluster requests are issued in parallel over the pooled session instead of one
+        cluster at a time.
+
+        Args:
+            labels (List[str]): List of labels to search for, e.g., ["cat", "dog"]
+            max_workers (int): Maximum number of clusters fetched at once (default: 16)
+
+        Returns:
+            pd.DataFrame: DataFrame containing all images from matching clusters
+        """
+        import pandas as pd
+
+        if not labels:
+            return pd.DataFrame()
+
+        labels_param = dumps(labels)
+        cluster_ids = self._get_label_cluster_ids(labels_param)
+        previews = self.client.map(lambda cluster_id: self._get_label_cluster_previews(cluster_id, labels_param), cluster_ids, max_workers=max_workers)
+        return self._label_previews_to_dataframe(list(zip(cluster_ids, previews)))
+
+    def _get_label_cluster_ids(self, labels_param: str) -> list:
+        """Page through the explore endpoint and collect the IDs of clusters matching the labels"""
         cluster_ids = []
         all_cluster_ids = set()
         page_number = 0
         while True:
-            params = {"labels": json.dumps(labels), "page_number": page_number}
-            response = self.client.session.get(
-                f"{self.base_url}/explore/{self.dataset_id}",
-                params=params,
-                headers=self.client._get_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
+            params = {"labels": labels_param, "page_number": page_number}
+            data = self.client._get_json(self._explore_url, params=params)
             clusters = data.get("clusters", [])
             if not clusters:
                 break
@@ -192,39 +246,44 @@ class Dataset:
                     cluster_ids.append(cluster_id)
                     all_cluster_ids.add(cluster_id)
             page_number += 1
+        return cluster_ids
+
+    def _get_label_cluster_previews(self, cluster_id: str, labels_param: str) -> list:
+        """Page through one similarity cluster and return all of its previews"""
+        previews = []
+        page_number = 0
+        while True:
+            cluster_params = {"verbose": "true", "labels": labels_param, "page_number": page_number}
+            cluster_data = self.client._get_json(f"{self._explore_url}/similarity_cluster/{cluster_id}", params=cluster_params)
+            if cluster_data is None:
+                break
+            page = cluster_data.get("previews", [])
+            if not page:
+                break
+            previews.extend(page)
+            page_number += 1
+        return previews
+
+    @staticmethod
+    def _label_previews_to_dataframe(cluster_previews: list) -> "pd.DataFrame":
+        """Flatten (cluster_id, previews) pairs into one row per unique image"""
+        import pandas as pd
 
-        # --- Paginate image retrieval for each cluster ---
         all_images = []
         seen_image_ids = set()
-        for cluster_id in cluster_ids:
-            page_number = 0
-            while True:
-                cluster_params = {"verbose": "true", "labels": json.dumps(labels), "page_number": page_number}
-                cluster_response = self.client.session.get(
-                    f"{self.base_url}/explore/{self.dataset_id}/similarity_cluster/{cluster_id}",
-                    params=cluster_params,
-                    headers=self.client._get_headers(),
-                )
-                cluster_response.raise_for_status()
-                cluster_data = cluster_response.json()
-                if cluster_data is None:
-                    break
-                previews = cluster_data.get("previews", [])
-                if not previews:
-                    break
-                for preview in previews:
-                    image_id = preview.get("image_id") or preview.get("id")
-                    if image_id and image_id in seen_image_ids:
-                        continue
-                    if image_id:
-                        seen_image_ids.add(image_id)
-                    image_data = preview.copy()
-                    image_labels = preview.get("labels", [])
-                    if isinstance(image_labels, list):
-                        image_data["labels"] = ", ".join(image_labels)
-                    image_data["cluster_id"] = cluster_id
-                    all_images.append(image_data)
-                page_number += 1
+        for cluster_id, previews in cluster_previews:
+            for preview in previews:
+                image_id = preview.get("image_id") or preview.get("id")
+                if image_id and image_id in seen_image_ids:
+                    continue
+                if image_id:
+                    seen_image_ids.add(image_id)
+                image_data = preview.copy()
+                image_labels = preview.get("labels", [])
+                if isinstance(image_labels, list):
+                    image_data["labels"] = ", ".join(image_labels)
+                image_data["cluster_id"] = cluster_id
+                all_images.append(image_data)
 
         if all_images:
             df = pd.DataFrame(all_images)
@@ -232,24 +291,67 @@ class Dataset:
         else:
             return pd.DataFrame()
 
+    def fetch_all(self, fields: tuple = ("details", "stats", "explore"), ttl: float = CACHE_TTL_SECONDS) -> dict:
+        """
+        Fetch several views of this dataset concurrently and cache them on this object.
+
+        Args:
+            fields (tuple): Any of "details", "stats" and "explore" (default: all three)
+            ttl (float): Seconds a cached result is reused before it is fetched again (default: 5)
+
+        Returns:
+            dict: Mapping of each requested field to its result
+        """
+        fetchers = {"details": self._fetch_details, "stats": self.get_stats, "explore": self.explore}
+        unknown = [field for field in fields if field not in fetchers]
+        if unknown:
+            raise ValueError(f"Unknown fields: {unknown}. Expected any of {list(fetchers)}")
+
+        now = time.monotonic()
+        results = {}
+        missing = []
+        for field in fields:
+            cached = self._cache.get(field)
+            if cached is not None and now - cached[0] < ttl:
+                results[field] = cached[1]
+            else:
+                missing.append(field)
+
+        if missing:
+            # Issue the remaining requests in parallel over the client's pooled session
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                futures = {field: executor.submit(fetchers[field]) for field in missing}
+            fetched_at = time.monotonic()
+            for field, future in futures.items():
+                results[field] = future.result()
+                self._cache[field] = (fetched_at, results[field])
+
+        return results
+
+    def invalidate(self):
+        """Drop any results cached by get_details() or fetch_all()"""
+        self._cache.clear()
+
     def delete(self) -> dict:
         """Delete this dataset"""
-        response = self.client.session.delete(
-            f"{self.base_url}/dataset/{self.dataset_id}",
-            headers=self.client._get_headers(),
-        )
+        response = self.client.session.delete(self._url)
         response.raise_for_status()
-        return response.json()
+        self.invalidate()
+        return response_json(response)
 
     def get_image_info(self, image_id) -> list:
-        response = self.client.session.get(
-            f"{self.base_url}/image/{image_id}",
-            headers=self.client._get_headers(),
-        )
-        response.raise_for_status()
-        return response.json()
+        return self.client._get_json(f"{self.client.base_url}/image/{image_id}")
 
     # include image_uri in export
+    def _request_export(self, stream: bool = False, export_format: str = "json"):
+        """Request an export of this dataset and return the raw response"""
+        response = self.client.session.get(self._url + "/export", params={"export_format": export_format}, stream=stream)
+        if response.status_code >= 400:
+            # A streamed response holds its pooled connection until closed, and the caller never gets it to close
+            response.close()
+            response.raise_for_status()
+        return response
+
     def export(self) -> dict:
         """Export this dataset in JSON format"""
         # Check if dataset is ready before exporting
@@ -257,20 +359,20 @@ class Dataset:
         if status not in ["READY", "completed"]:
             raise RuntimeError(f"Cannot export dataset {self.dataset_id}. Current status: {status}. Dataset must be 'ready' or 'completed' to export.")
 
-        url = f"{self.base_url}/dataset/{self.dataset_id}/export"
-        params = {"export_format": "json"}
-        headers = {**self.client._get_headers()}
-        response = self.client.session.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return response_json(self._request_export())
 
-    def export_to_dataframe(self) -> pd.DataFrame:
+    def export_to_dataframe(self) -> "pd.DataFrame":
         """
         Export this dataset and convert media_items to a DataFrame.
 
+        When the optional ``ijson`` package is installed the export is streamed and
+        media_items are parsed one at a time, so the full JSON document is never held in memory.
+
         Returns:
             pd.DataFrame: DataFrame containing media_items (excluding metadata_items)
         """
+        import pandas as pd
+
         try:
             # Check if dataset is ready before exporting
             status = self.get_status()
@@ -278,22 +380,28 @@ class Dataset:
                 self.logger.dataset_not_ready(self.dataset_id, status)
                 return pd.DataFrame()
 
+            if ijson is not None:
+                with self._request_export(stream=True) as response:
+                    response.raw.decode_content = True
+                    # Drop metadata_items as each item is parsed
+                    media_items = [{k: v for k, v in item.items() if k != "metadata_items"} for item in ijson.items(response.raw, "media_items.item", use_float=True)]
+
+                if not media_items:
+                    self.logger.warning("No media_items found in export data")
+                    return pd.DataFrame()
+
+                df = pd.DataFrame.from_records(media_items)
+                self.logger.export_completed(self.dataset_id, len(df))
+                return df
+
             # Export the dataset
-            export_data = self.export()
+            export_data = response_json(self._request_export())
 
             # Extract media_items from the export data
             if "media_items" in export_data:
-                media_items = export_data["media_items"]
-
-                # Remove metadata_items from each media item if it exists
-                cleaned_media_items = []
-                for item in media_items:
-                    # Create a copy of the item without metadata_items
-                    cleaned_item = {k: v for k, v in item.items() if k != "metadata_items"}
-                    cleaned_media_items.append(cleaned_item)
-
-                # Convert to DataFrame
-                df = pd.DataFrame(cleaned_media_items)
+                # Build the DataFrame straight from the parsed items and drop metadata_items as a column,
+                # instead of copying every item into a new dict first
+                df = pd.DataFrame(export_data["media_items"]).drop(columns="metadata_items", errors="ignore")
                 self.logger.export_completed(self.dataset_id, len(df))
                 return df
             else:
@@ -304,6 +412,43 @@ class Dataset:
             self.logger.export_failed(self.dataset_id, str(e))
             return pd.DataFrame()
 
+    def export_to_dataframe_fast(self) -> "pd.DataFrame":
+        """
+        Export this dataset as NDJSON and read it straight into a DataFrame.
+
+        The streamed response is handed to ``pd.read_json(lines=True)`` so no intermediate
+        list of dicts is built. If the server does not answer with NDJSON the regular JSON
+        export payload is parsed instead.
+
+        Returns:
+            pd.DataFrame: DataFrame containing media_items (excluding metadata_items)
+        """
+        import pandas as pd
+
+        try:
+            # Check if dataset is ready before exporting
+            status = self.get_status()
+            if status not in ["READY", "completed"]:
+                self.logger.dataset_not_ready(self.dataset_id, status)
+                return pd.DataFrame()
+
+            with self._request_export(stream=True, export_format="jsonl") as response:
+                content_type = response.headers.get("Content-Type", "")
+                if "ndjson" in content_type or "jsonl" in content_type:
+                    response.raw.decode_content = True
+                    df = pd.read_json(response.raw, lines=True)
+                else:
+                    self.logger.debug("Export returned %s, falling back to JSON parsing", content_type or "no content type")
+                    df = pd.DataFrame(loads(response.content).get("media_items", []))
+
+            df = df.drop(columns="metadata_items", errors="ignore")
+            self.logger.export_completed(self.dataset_id, len(df))
+            return df
+
+        except Exception as e:
+            self.logger.export_failed(self.dataset_id, str(e))
+            return pd.DataFrame()
+
     def get_status(self) -> dict:
         return self.get_details()["status"]
 
@@ -323,7 +468,7 @@ class Dataset:
             self.logger.warning("No caption text provided")
             return {}
 
-        url = f"{self.base_url}/dataset/{self.dataset_id}/export_context_async"
+        url = self._url + "/export_context_async"
 
         params = {"export_format": "json", "include_images": False, "caption_only_filter": caption_text}
 
@@ -332,16 +477,10 @@ class Dataset:
             self.logger.info(f"API URL: {url}")
             self.logger.info(f"API Parameters: {params}")
 
-            response = self.client.session.get(url, headers=self.client._get_headers(), params=params)
-            response.raise_for_status()
-
-            result = response.json()
+            result = self.client._get_json(url, params=params)
 
-            # Print raw API response
-            print(f"\n📄 RAW API RESPONSE for caption search:")
-            print(f"Response type: {type(result)}")
-            print(f"Response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
-            print(f"Full response: {json.dumps(result, indent=2)}")
+            # The raw API response is only serialised when debug logging is enabled
+            self.logger.debug("Caption search raw API response: %s", result)
 
             self.logger.success(f"Caption search export task created successfully")
             return result
@@ -366,14 +505,12 @@ class Dataset:
             return {}
 
         # Step 1: Start export task
-        url_context = f"{self.base_url}/dataset/{self.dataset_id}/export_context_async"
-        params = {"export_format": "json", "include_images": False, "labels": json.dumps(labels)}
+        url_context = self._url + "/export_context_async"
+        params = {"export_format": "json", "include_images": False, "labels": dumps(labels)}
 
         try:
             self.logger.info(f"Starting label search export task: {labels}")
-            response = self.client.session.get(url_context, headers=self.client._get_headers(), params=params)
-            response.raise_for_status()
-            result = response.json()
+            result = self.client._get_json(url_context, params=params)
             self.logger.success(f"Label search export task created successfully")
         except Exception as e:
             self.logger.error(f"Label search export_context_async failed: {str(e)}")
@@ -385,20 +522,18 @@ class Dataset:
             self.logger.error("No export_task_id returned from export_context_async")
             return {}
 
-        url_status = f"{self.base_url}/dataset/{self.dataset_id}/export_status"
+        url_status = self._url + "/export_status"
         status_params = {"export_task_id": export_task_id, "dataset_id": self.dataset_id}
         try:
             self.logger.info(f"Polling export status for task: {export_task_id}")
-            status_response = self.client.session.get(url_status, headers=self.client._get_headers(), params=status_params)
-            status_response.raise_for_status()
-            status_result = status_response.json()
+            status_result = self.client._get_json(url_status, params=status_params)
             self.logger.success(f"Export status checked successfully")
             return status_result
         except Exception as e:
             self.logger.error(f"Export status check failed: {str(e)}")
             raise
 
-    def process_export_download_to_dataframe(self, download_uri: str) -> pd.DataFrame:
+    def process_export_download_to_dataframe(self, download_uri: str) -> "pd.DataFrame":
         """
         Download the export results from the provided URI and flatten to a DataFrame.
         Can be used by any async search function that returns a download_uri.
@@ -409,6 +544,8 @@ class Dataset:
         Returns:
             pd.DataFrame: DataFrame containing the search results, or empty if not valid
         """
+        import pandas as pd
+
         # Download and process the export results
         export_data = self.download_export_results(download_uri)
         if not export_data or "media_items" not in export_data:
@@ -458,7 +595,7 @@ class Dataset:
         self.logger.export_completed(self.dataset_id, len(df))
         return df
 
-    def search_by_labels_async_to_dataframe(self, labels: List[str], poll_interval: int = 10, timeout: int = 300) -> pd.DataFrame:
+    def search_by_labels_async_to_dataframe(self, labels: List[str], poll_interval: int = 10, timeout: int = 300) -> "pd.DataFrame":
         """
         Search dataset by labels asynchronously, poll until export is ready, download the results, and return as a DataFrame.
 
@@ -470,7 +607,7 @@ class Dataset:
         Returns:
             pd.DataFrame: DataFrame containing the search results, or empty if not ready
         """
-        import time
+        import pandas as pd
 
         start_time = time.time()
 
@@ -485,13 +622,7 @@ class Dataset:
             self.logger.info(f"Export not ready (status: {status}). Waiting {poll_interval}s before polling again...")
             time.sleep(poll_interval)
             # Poll status endpoint
-            poll_status = self.client.session.get(
-                f"{self.client.base_url}/dataset/{self.dataset_id}/export_status",
-                headers=self.client._get_headers(),
-                params={"export_task_id": export_task_id, "dataset_id": self.dataset_id},
-            )
-            poll_status.raise_for_status()
-            status_result = poll_status.json()
+            status_result = self.client._get_json(self._url + "/export_status", params={"export_task_id": export_task_id, "dataset_id": self.dataset_id})
             download_uri = status_result.get("download_uri")
             status = status_result.get("status")
 
@@ -522,32 +653,36 @@ class Dataset:
             response.raise_for_status()
 
             content_type = response.headers.get("content-type", "")
-            self.logger.debug(f"Response content type: {content_type}")
-            self.logger.debug(f"Response status code: {response.status_code}")
-            self.logger.debug(f"Response size: {len(response.content)} bytes")
+            debug = self.logger.is_debug_enabled()
+            if debug:
+                self.logger.debug(f"Response content type: {content_type}")
+                self.logger.debug(f"Response status code: {response.status_code}")
+                self.logger.debug(f"Response size: {len(response.content)} bytes")
 
             # Try ZIP extraction first (since we know it works)
             self.logger.info("Attempting ZIP extraction...")
             try:
                 with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-                    self.logger.debug(f"ZIP contents: {zf.namelist()}")
+                    if debug:
+                        self.logger.debug(f"ZIP contents: {zf.namelist()}")
 
                     # Look specifically for metadata.json
                     if "metadata.json" in zf.namelist():
                         self.logger.info("Found metadata.json")
                         with zf.open("metadata.json") as json_file:
-                            json_bytes = json_file.read()
-                            json_str = json_bytes.decode("utf-8")
-                            result = json.loads(json_str)
+                            # Parse the bytes directly; no intermediate str copy of the (potentially large) export
+                            result = loads(json_file.read())
                             self.logger.info(f"Successfully extracted and parsed JSON")
-                            self.logger.debug(f"JSON keys: {list(result.keys())}")
+                            if debug:
+                                self.logger.debug(f"JSON keys: {list(result.keys())}")
                             if "media_items" in result:
                                 self.logger.info(f"Number of media items: {len(result['media_items'])}")
                             self.logger.success(f"Export results downloaded and extracted from ZIP successfully")
                             return result
                     else:
                         self.logger.warning("metadata.json not found")
-                        self.logger.debug(f"Available files: {zf.namelist()}")
+                        if debug:
+                            self.logger.debug(f"Available files: {zf.namelist()}")
                         raise ValueError("metadata.json not found in ZIP archive.")
 
             except Exception as zip_error:
@@ -556,20 +691,23 @@ class Dataset:
 
             # If ZIP extraction failed, try JSON parsing
             if "application/json" in content_type:
-                result = response.json()
-                self.logger.debug(f"Parsed as JSON")
-                self.logger.debug(f"Response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
+                result = response_json(response)
+                if debug:
+                    self.logger.debug("Parsed as JSON")
+                    self.logger.debug(f"Response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
                 self.logger.success(f"Export results downloaded successfully")
                 return result
             else:
                 # Handle non-JSON responses (like text)
-                self.logger.debug(f"Content type: {content_type}")
-                self.logger.debug(f"Response size: {len(response.content)} bytes")
+                if debug:
+                    self.logger.debug(f"Content type: {content_type}")
+                    self.logger.debug(f"Response size: {len(response.content)} bytes")
                 # Try to parse as JSON anyway (in case content-type is wrong)
                 try:
-                    result = response.json()
+                    result = response_json(response)
                     self.logger.info("Successfully parsed as JSON")
-                    self.logger.debug(f"Response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
+                    if debug:
+                        self.logger.debug(f"Response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
                 except Exception as json_error:
                     self.logger.warning(f"Failed to parse as JSON: {str(json_error)}")
                     result = {"content_type": content_type, "size_bytes": len(response.content), "raw_text": response.text[:1000], "error": "Response is not valid JSON"}
@@ -0,0 +1,33 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Serialise to a compact JSON string"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def response_json(response):
+    """Parse a response body straight from its raw bytes, skipping the charset detection and str decode of response.json()"""
+    try:
+        return loads(response.content)
+    except json.JSONDecodeError as e:
+        # Raise the same exception as response.json(), which is a RequestException as well as a ValueError
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
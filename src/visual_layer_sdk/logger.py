@@ -94,9 +94,13 @@ class VisualLayerLogger:
         """Log success message"""
         self.logger.info(f"✅ {message}")
 
-    def debug(self, message: str):
-        """Log debug message"""
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        """Log debug message, deferring %-style formatting of ``args`` until the message is actually emitted"""
+        self.logger.debug(message, *args)
+
+    def is_debug_enabled(self) -> bool:
+        """Check whether debug messages will be emitted (use to skip building expensive debug output)"""
+        return self.logger.isEnabledFor(logging.DEBUG)
 
     def dataset_created(self, dataset_id: str, dataset_name: str):
         """Log dataset creation success"""
@@ -139,11 +143,11 @@ class VisualLayerLogger:
 
     def request_details(self, url: str, method: str = "GET"):
         """Log request details (debug level)"""
-        self.debug(f"{method} {url}")
+        self.debug("%s %s", method, url)
 
     def request_success(self, status_code: int):
         """Log successful request"""
-        self.debug(f"Request successful (Status: {status_code})")
+        self.debug("Request successful (Status: %s)", status_code)
 
     def request_error(self, error: str):
         """Log request error"""
@@ -0,0 +1,134 @@
+"""Tests for the AsyncVisualLayerClient."""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from src.visual_layer_sdk import async_client as async_client_module  # noqa: E402
+from src.visual_layer_sdk.async_client import AsyncVisualLayerClient, _AdaptiveLimiter  # noqa: E402
+
+
+class TestAsyncVisualLayerClient:
+    """Test cases for AsyncVisualLayerClient."""
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        """Test that a missing h2 package downgrades to HTTP/1.1 instead of raising."""
+        real_find_spec = async_client_module.importlib.util.find_spec
+        monkeypatch.setattr(async_client_module.importlib.util, "find_spec", lambda name: None if name == "h2" else real_find_spec(name))
+
+        async def run():
+            async with AsyncVisualLayerClient("test_key", "test_secret") as client:
+                return client.http2
+
+        assert asyncio.run(run()) is False
+
+    def test_fetch_dataset(self):
+        """Test that details, stats and explore are fetched with a JWT."""
+        seen_paths = []
+
+        def handler(request):
+            seen_paths.append(request.url.path)
+            assert request.headers["Authorization"].startswith("Bearer ")
+            return httpx.Response(200, json={"path": request.url.path})
+
+        async def run():
+            async with AsyncVisualLayerClient("test_key", "test_secret") as client:
+                client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await client.fetch_dataset("abc")
+
+        result = asyncio.run(run())
+
+        assert result["details"] == {"path": "/api/v1/dataset/abc"}
+        assert result["stats"] == {"path": "/api/v1/dataset/abc/stats"}
+        assert result["explore"] == {"path": "/api/v1/explore/abc"}
+        assert sorted(seen_paths) == ["/api/v1/dataset/abc", "/api/v1/dataset/abc/stats", "/api/v1/explore/abc"]
+
+    def test_get_datasets_bulk(self):
+        """Test that bulk details come back in request order."""
+
+        def handler(request):
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+        async def run():
+            async with AsyncVisualLayerClient("test_key", "test_secret") as client:
+                client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await client.get_datasets_bulk(["a", "b", "c"])
+
+        assert asyncio.run(run()) == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+
+    def test_get_similarity_clusters(self):
+        """Test that cluster fan-out respects the concurrency bound and keeps order."""
+        in_flight = []
+        peak = []
+
+        async def handler(request):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            assert request.url.params["verbose"] == "true"
+            assert request.url.params["labels"] == '["cat"]'
+            return httpx.Response(200, json={"cluster": request.url.path.rsplit("/", 1)[-1]})
+
+        async def run():
+            async with AsyncVisualLayerClient("test_key", "test_secret") as client:
+                client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await client.get_similarity_clusters("abc", [str(i) for i in range(8)], labels=["cat"], max_concurrency=2)
+
+        assert asyncio.run(run()) == [{"cluster": str(i)} for i in range(8)]
+        assert max(peak) <= 2
+
+    def test_get_similarity_clusters_retries_overload(self, monkeypatch):
+        """Test that 429s are retried and shrink the concurrency window."""
+        monkeypatch.setattr(async_client_module, "OVERLOAD_BACKOFF_SECONDS", 0)
+        failures = {"0": 2}
+
+        def handler(request):
+            cluster_id = request.url.path.rsplit("/", 1)[-1]
+            if failures.get(cluster_id):
+                failures[cluster_id] -= 1
+                return httpx.Response(429)
+            return httpx.Response(200, json={"cluster": cluster_id})
+
+        async def run():
+            async with AsyncVisualLayerClient("test_key", "test_secret") as client:
+                client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await client.get_similarity_clusters("abc", ["0", "1"])
+
+        assert asyncio.run(run()) == [{"cluster": "0"}, {"cluster": "1"}]
+        assert failures == {"0": 0}
+
+    def test_adaptive_limiter(self):
+        """Test that the window grows on success and halves on overload."""
+
+        async def run():
+            limiter = _AdaptiveLimiter(max_limit=8, initial_limit=4)
+            for _ in range(8):
+                await limiter.acquire()
+                await limiter.release()
+            grown = limiter.limit
+            await limiter.acquire()
+            await limiter.release(overloaded=True)
+            return grown, limiter.limit
+
+        grown, shrunk = asyncio.run(run())
+        assert 4 < grown <= 8
+        assert shrunk == grown / 2
+
+    def test_wait_ready(self):
+        """Test that each dataset is polled until it reaches a final status."""
+        responses = {"a": ["PROCESSING", "READY"], "b": ["PROCESSING", "PROCESSING", "ERROR"]}
+
+        def handler(request):
+            dataset_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"status": responses[dataset_id].pop(0)})
+
+        async def run():
+            async with AsyncVisualLayerClient("test_key", "test_secret") as client:
+                client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await client.wait_ready(["a", "b"], interval=0)
+
+        assert asyncio.run(run()) == {"a": "READY", "b": "ERROR"}
+        assert responses == {"a": [], "b": []}
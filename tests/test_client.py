@@ -1,6 +1,28 @@
 """Tests for the VisualLayerClient."""
 
-from src.visual_layer_sdk.client import VisualLayerClient
+import io
+import json
+import threading
+import time
+from urllib.parse import parse_qs
+
+import pytest
+import requests
+
+from src.visual_layer_sdk.client import VisualLayerClient, _dataset_form_body, _throttle_on_rate_limit
+
+
+def _fake_response(status_code: int = 200, content: bytes = None, raw=None, headers: dict = None) -> requests.Response:
+    """Build a requests.Response with either a preloaded body or a raw stream"""
+    response = requests.Response()
+    response.status_code = status_code
+    if content is not None:
+        response._content = content
+    if raw is not None:
+        response.raw = raw
+    if headers:
+        response.headers.update(headers)
+    return response
 
 
 class TestVisualLayerClient:
@@ -17,6 +39,51 @@ class TestVisualLayerClient:
         assert client.api_secret == api_secret
         assert client.base_url == "https://app.visual-layer.com/api/v1"
 
+    def test_cache_ttl(self, monkeypatch):
+        """Test that cache_ttl swaps in a caching session and needs requests-cache."""
+        from src.visual_layer_sdk import client as client_module
+
+        assert type(VisualLayerClient("test_key", "test_secret").session) is requests.Session
+
+        monkeypatch.setattr(client_module, "requests_cache", None)
+        with pytest.raises(ImportError):
+            VisualLayerClient("test_key", "test_secret", cache_ttl=60)
+
+    def test_cache_ttl_scope(self):
+        """Test that only the dataset listing and details are cached."""
+        requests_cache = pytest.importorskip("requests_cache")
+        from requests_cache.policy.expiration import get_url_expiration
+
+        client = VisualLayerClient("test_key", "test_secret", cache_ttl=60)
+        urls_expire_after = client.session.settings.urls_expire_after
+        dataset_url = f"{client.base_url}/dataset/abc"
+
+        assert get_url_expiration(f"{client.base_url}/datasets", urls_expire_after) == 60
+        assert get_url_expiration(dataset_url, urls_expire_after) == 60
+        for url in (f"{dataset_url}/export", f"{dataset_url}/export_status", f"{dataset_url}/export_context_async", f"{dataset_url}/stats", "https://bucket.s3.amazonaws.com/export.zip"):
+            assert get_url_expiration(url, urls_expire_after) == requests_cache.DO_NOT_CACHE
+
+    def test_cache_ttl_listing_is_reusable(self, monkeypatch):
+        """Test that a cached dataset listing can be iterated again after the stream was consumed."""
+        pytest.importorskip("requests_cache")
+        from requests.adapters import HTTPAdapter
+        from urllib3 import HTTPResponse
+
+        records = [{"id": "a"}, {"id": "b"}]
+        sent = []
+
+        def fake_send(self, request, **kwargs):
+            sent.append(request.url)
+            raw = HTTPResponse(body=io.BytesIO(json.dumps(records).encode()), status=200, headers={"Content-Type": "application/json"}, preload_content=False)
+            return self.build_response(request, raw)
+
+        monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+        client = VisualLayerClient("test_key", "test_secret", cache_ttl=60)
+
+        assert list(client.iter_all_datasets()) == records
+        assert list(client.iter_all_datasets()) == records
+        assert len(sent) == 1
+
     def test_generate_jwt(self):
         """Test JWT token generation."""
         api_key = "test_key"
@@ -28,6 +95,38 @@ class TestVisualLayerClient:
         assert jwt_token is not None
         assert isinstance(jwt_token, str)
 
+    def test_generate_jwt_is_valid_hs256(self):
+        """Test that the hand-signed JWT verifies with PyJWT."""
+        jwt = pytest.importorskip("jwt")
+        api_key = "test_key"
+        api_secret = "test_secret_that_is_at_least_32_bytes"
+
+        client = VisualLayerClient(api_key, api_secret)
+        jwt_token = client._generate_jwt()
+
+        assert jwt.get_unverified_header(jwt_token) == {"alg": "HS256", "typ": "JWT", "kid": api_key}
+        payload = jwt.decode(jwt_token, api_secret, algorithms=["HS256"])
+        assert payload["sub"] == api_key
+        assert payload["iss"] == "sdk"
+        assert payload["exp"] - payload["iat"] == 600
+
+    @pytest.mark.parametrize("algorithm", ["EdDSA", "ES256"])
+    def test_generate_jwt_with_pem_key(self, algorithm):
+        """Test that PEM private keys sign asymmetric JWTs that verify with PyJWT."""
+        jwt = pytest.importorskip("jwt")
+        pytest.importorskip("cryptography")
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+        private_key = ed25519.Ed25519PrivateKey.generate() if algorithm == "EdDSA" else ec.generate_private_key(ec.SECP256R1())
+        pem = private_key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()).decode()
+
+        client = VisualLayerClient("test_key", pem)
+        jwt_token = client._generate_jwt()
+
+        assert jwt.get_unverified_header(jwt_token)["alg"] == algorithm
+        assert jwt.decode(jwt_token, private_key.public_key(), algorithms=[algorithm])["sub"] == "test_key"
+
     def test_get_headers(self):
         """Test header generation."""
         api_key = "test_key"
@@ -36,19 +135,402 @@ class TestVisualLayerClient:
         client = VisualLayerClient(api_key, api_secret)
         headers = client._get_headers()
 
-        assert "Authorization" in headers
-        assert headers["accept"] == "application/json"
-        assert headers["Content-Type"] == "application/json"
+        assert list(headers) == ["Authorization"]
         assert headers["Authorization"].startswith("Bearer ")
+        assert client._get_headers() is headers
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "Bearer other"
 
-    def test_get_headers_no_jwt(self):
-        """Test header generation without JWT."""
+    def test_session_headers(self):
+        """Test that static headers are set once on the session."""
         api_key = "test_key"
         api_secret = "test_secret"
 
         client = VisualLayerClient(api_key, api_secret)
-        headers = client._get_headers_no_jwt()
 
-        assert "Authorization" not in headers
-        assert headers["accept"] == "application/json"
-        assert headers["Content-Type"] == "application/json"
+        assert "Authorization" not in client.session.headers
+        assert client.session.headers["accept"] == "application/json"
+        assert client.session.headers["Content-Type"] == "application/json"
+
+    def test_verify(self, monkeypatch):
+        """Test that the CA bundle comes from the argument, then the environment, then the default."""
+        monkeypatch.delenv("REQUESTS_CA_BUNDLE", raising=False)
+        monkeypatch.delenv("CURL_CA_BUNDLE", raising=False)
+        assert VisualLayerClient("test_key", "test_secret").session.verify is True
+
+        monkeypatch.setenv("CURL_CA_BUNDLE", "/etc/ssl/corp.pem")
+        assert VisualLayerClient("test_key", "test_secret").session.verify == "/etc/ssl/corp.pem"
+        assert VisualLayerClient("test_key", "test_secret", verify="/tmp/other.pem").session.verify == "/tmp/other.pem"
+
+    def test_session_auth(self):
+        """Test that the JWT is attached to API requests but not to other hosts."""
+        client = VisualLayerClient("test_key", "test_secret")
+
+        api_request = client.session.prepare_request(requests.Request("GET", f"{client.base_url}/healthcheck"))
+        download_request = client.session.prepare_request(requests.Request("GET", "https://bucket.s3.amazonaws.com/export.zip?X-Amz-Signature=abc"))
+
+        assert api_request.headers["Authorization"] == f"Bearer {client._generate_jwt()}"
+        assert "Authorization" not in download_request.headers
+
+    def test_generate_jwt_is_cached(self):
+        """Test that the JWT is reused until it is close to expiry."""
+        client = VisualLayerClient("test_key", "test_secret")
+
+        first = client._generate_jwt()
+        assert client._generate_jwt() is first
+
+        # Pretend the cached token is about to expire
+        client._jwt_exp = 0
+        client._jwt_token = "stale"
+        assert client._generate_jwt() != "stale"
+
+    def test_session_adapter(self):
+        """Test that a pooled adapter is mounted on the session."""
+        client = VisualLayerClient("test_key", "test_secret")
+        adapter = client.session.get_adapter(client.base_url)
+
+        assert adapter._pool_maxsize == 32
+        assert client.session.get_adapter("http://example.com") is adapter
+        assert VisualLayerClient("test_key", "test_secret", pool_maxsize=64).session.get_adapter(client.base_url)._pool_maxsize == 64
+
+    def test_session_default_timeout(self, monkeypatch):
+        """Test that requests without an explicit timeout get the client's default."""
+        from requests.adapters import HTTPAdapter
+
+        seen = []
+
+        def fake_send(self, request, timeout=None, **kwargs):
+            seen.append(timeout)
+            return _fake_response(content=b"{}")
+
+        monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+        client = VisualLayerClient("test_key", "test_secret", timeout=(1, 2))
+
+        client.healthcheck()
+        client.session.get(client.base_url, timeout=7)
+
+        assert seen == [(1, 2), 7]
+
+    def test_session_ignores_environment_proxies(self):
+        """Test that proxies come only from the constructor, not the environment."""
+        client = VisualLayerClient("test_key", "test_secret")
+        proxied = VisualLayerClient("test_key", "test_secret", proxies={"https": "http://proxy:3128"})
+
+        assert client.session.trust_env is False
+        assert proxied.session.proxies == {"https": "http://proxy:3128"}
+
+    def test_session_retry(self):
+        """Test that idempotent requests are retried on transient errors."""
+        client = VisualLayerClient("test_key", "test_secret")
+        retry = client.session.get_adapter(client.base_url).max_retries
+
+        assert retry.total == 5
+        assert 503 in retry.status_forcelist
+        assert "POST" not in retry.allowed_methods
+
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}, [2.0]),
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3600"}, [60]),
+            ({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "2"}, []),
+            ({"X-RateLimit-Remaining": "0"}, []),
+        ],
+    )
+    def test_throttle_on_rate_limit(self, monkeypatch, headers, expected):
+        """Test that an exhausted rate limit window is waited out, capped at a minute."""
+        from src.visual_layer_sdk import client as client_module
+
+        slept = []
+        monkeypatch.setattr(client_module.time, "sleep", slept.append)
+        response = _fake_response(headers=headers)
+
+        _throttle_on_rate_limit(response)
+
+        assert slept == expected
+        assert _throttle_on_rate_limit in VisualLayerClient("test_key", "test_secret").session.hooks["response"]
+
+    def test_throttle_on_rate_limit_once_per_network_response(self, monkeypatch):
+        """Test that a re-dispatched hook and cache hits don't sleep again."""
+        from src.visual_layer_sdk import client as client_module
+
+        slept = []
+        monkeypatch.setattr(client_module.time, "sleep", slept.append)
+        headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}
+
+        response = _fake_response(headers=headers)
+        _throttle_on_rate_limit(response)
+        _throttle_on_rate_limit(response)
+
+        cached = _fake_response(headers=headers)
+        cached.from_cache = True
+        _throttle_on_rate_limit(cached)
+
+        assert slept == [2.0]
+
+    def test_map_preserves_order(self):
+        """Test that map returns results in input order."""
+        client = VisualLayerClient("test_key", "test_secret")
+
+        assert client.map(lambda x: x * 2, range(50), max_workers=8) == [x * 2 for x in range(50)]
+
+    def test_create_dataset_from_local_folder_validates_path(self, tmp_path):
+        """Test that missing files and directories are rejected before any request is made."""
+        client = VisualLayerClient("test_key", "test_secret")
+
+        with pytest.raises(ValueError, match="File not found"):
+            client.create_dataset_from_local_folder(str(tmp_path / "missing.zip"), "missing.zip", "My Dataset")
+        with pytest.raises(ValueError, match="Not a file"):
+            client.create_dataset_from_local_folder(str(tmp_path), "images.zip", "My Dataset")
+
+    def test_create_datasets_from_local_folders(self, monkeypatch, tmp_path):
+        """Test that batch creation validates every path first and keeps input order."""
+        paths = []
+        for name in ("a.zip", "b.zip", "c.zip"):
+            (tmp_path / name).write_bytes(b"zip")
+            paths.append(str(tmp_path / name))
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(VisualLayerClient, "create_dataset_from_local_folder", lambda self, file_path, filename, dataset_name, pipeline_type=None: (filename, dataset_name))
+
+        assert client.create_datasets_from_local_folders([(p, p[-5]) for p in paths]) == [("a.zip", "a"), ("b.zip", "b"), ("c.zip", "c")]
+        with pytest.raises(ValueError, match="File not found"):
+            client.create_datasets_from_local_folders([(paths[0], "a"), (str(tmp_path / "missing.zip"), "m")])
+
+    def test_create_datasets_from_local_folders_partial_failure(self, monkeypatch, tmp_path):
+        """Test that one failed upload is reported in place without losing the datasets that were created."""
+        paths = []
+        for name in ("a.zip", "b.zip", "c.zip"):
+            (tmp_path / name).write_bytes(b"zip")
+            paths.append(str(tmp_path / name))
+
+        def fake_create(self, file_path, filename, dataset_name, pipeline_type=None):
+            if dataset_name == "b":
+                raise requests.exceptions.RequestException("upload failed")
+            return dataset_name
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(VisualLayerClient, "create_dataset_from_local_folder", fake_create)
+
+        results = client.create_datasets_from_local_folders([(p, p[-5]) for p in paths])
+
+        assert results[0] == "a" and results[2] == "c"
+        assert isinstance(results[1], requests.exceptions.RequestException)
+
+    def test_dataset_form_body(self):
+        """Test that the pre-encoded creation form round-trips every field."""
+        body = _dataset_form_body("My Dataset & more", bucket_path="bucket/images", pipeline_type=None)
+
+        assert parse_qs(body, keep_blank_values=True) == {
+            "vl_dataset_id": [""],
+            "config_url": [""],
+            "dataset_name": ["My Dataset & more"],
+            "bucket_path": ["bucket/images"],
+            "uploaded_filename": [""],
+            "pipeline_type": [""],
+        }
+
+    def test_create_dataset_from_s3_bucket(self, monkeypatch):
+        """Test that S3 creation posts the encoded form and surfaces API error messages."""
+        posted = []
+
+        def fake_post(url, data=None, headers=None, timeout=None):
+            posted.append(parse_qs(data, keep_blank_values=True))
+            if len(posted) == 1:
+                return _fake_response(content=b'{"id": "bc41491e-78ae-11ef-ba4b-8a774758b536"}')
+            return _fake_response(status_code=400, content=b'{"message": "Bucket not found"}')
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "post", fake_post)
+
+        dataset = client.create_dataset_from_s3_bucket("bucket/images", "My Dataset")
+        assert dataset.dataset_id == "bc41491e-78ae-11ef-ba4b-8a774758b536"
+        assert posted[0]["bucket_path"] == ["bucket/images"]
+        assert posted[0]["uploaded_filename"] == [""]
+
+        with pytest.raises(requests.exceptions.RequestException, match="Bucket not found"):
+            client.create_dataset_from_s3_bucket("bucket/missing", "My Dataset")
+
+    def test_create_dataset_from_local_folder_uploads_file(self, monkeypatch, tmp_path):
+        """Test that the dataset is created and the zip is then posted as multipart."""
+        from src.visual_layer_sdk import client as client_module
+
+        monkeypatch.setattr(client_module, "MultipartEncoder", None)
+        zip_path = tmp_path / "images.zip"
+        zip_path.write_bytes(b"PK\x05\x06" + b"\x00" * 18)
+        posted = []
+
+        def fake_post(url, data=None, files=None, headers=None, timeout=None):
+            posted.append((url, files))
+            return _fake_response(content=b'{"id": "bc41491e-78ae-11ef-ba4b-8a774758b536"}')
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "post", fake_post)
+
+        dataset = client.create_dataset_from_local_folder(str(zip_path), "images.zip", "My Dataset")
+
+        assert dataset.dataset_id == "bc41491e-78ae-11ef-ba4b-8a774758b536"
+        assert posted[1][0].endswith("/dataset/bc41491e-78ae-11ef-ba4b-8a774758b536/upload")
+        assert posted[1][1]["file"][0] == "images.zip"
+
+    def test_context_manager_closes_session(self, monkeypatch):
+        """Test that leaving the context manager closes the session."""
+        closed = []
+
+        with VisualLayerClient("test_key", "test_secret") as client:
+            monkeypatch.setattr(client.session, "close", lambda: closed.append(True))
+
+        assert closed == [True]
+
+    @pytest.mark.parametrize("use_ijson", [True, False])
+    def test_iter_all_datasets(self, monkeypatch, use_ijson):
+        """Test that datasets are yielded one by one from the listing response."""
+        from src.visual_layer_sdk import client as client_module
+
+        if use_ijson:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(client_module, "ijson", None)
+
+        body = b'[{"id": "a", "n_images": 2}, {"id": "b", "n_images": 1.5}]'
+
+        def fake_get(url, **kwargs):
+            return _fake_response(raw=io.BytesIO(body))
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "get", fake_get)
+
+        assert list(client.iter_all_datasets()) == [{"id": "a", "n_images": 2}, {"id": "b", "n_images": 1.5}]
+
+    @pytest.mark.parametrize("server_pages", [True, False])
+    @pytest.mark.parametrize("n_records", [5, 2])
+    def test_iter_all_datasets_paginated(self, monkeypatch, server_pages, n_records):
+        """Test that pages are requested until a short page, and that an unpaged server is not re-queried."""
+        records = [{"id": str(i)} for i in range(n_records)]
+        requested = []
+
+        def fake_get(url, params=None, **kwargs):
+            requested.append(params)
+            page = records[params["offset"] : params["offset"] + params["limit"]] if server_pages else records
+            return _fake_response(raw=io.BytesIO(json.dumps(page).encode()))
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "get", fake_get)
+
+        assert list(client.iter_all_datasets(page_size=2)) == records
+        if server_pages:
+            assert requested == [{"limit": 2, "offset": offset} for offset in range(0, n_records + 1, 2)]
+        elif n_records == 2:
+            # A full listing exactly page_size long is re-requested once and recognised as a repeat
+            assert requested == [{"limit": 2, "offset": 0}, {"limit": 2, "offset": 2}]
+        else:
+            assert requested == [{"limit": 2, "offset": 0}]
+
+    @pytest.mark.parametrize("page_size", [0, -1])
+    def test_iter_all_datasets_rejects_bad_page_size(self, monkeypatch, page_size):
+        """Test that a page size below 1 is rejected before anything is requested."""
+        requested = []
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "get", lambda url, **kwargs: requested.append(url))
+
+        with pytest.raises(ValueError, match="page_size"):
+            list(client.iter_all_datasets(page_size=page_size))
+        assert requested == []
+
+    def test_iter_datasets(self, monkeypatch):
+        """Test that listed datasets are yielded as Dataset objects."""
+        from src.visual_layer_sdk.dataset import Dataset
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(VisualLayerClient, "iter_all_datasets", lambda self, page_size=None: iter([{"id": "bc41491e-78ae-11ef-ba4b-8a774758b536"}]))
+
+        datasets = list(client.iter_datasets())
+        assert len(datasets) == 1
+        assert isinstance(datasets[0], Dataset)
+        assert datasets[0].client is client
+        assert datasets[0].dataset_id == "bc41491e-78ae-11ef-ba4b-8a774758b536"
+
+    def test_get_all_datasets(self, monkeypatch):
+        """Test that the listing is projected onto the selected fields, filling missing ones."""
+
+        def fake_get(url, **kwargs):
+            return _fake_response(content=b'[{"id": "a", "status": "READY", "extra": 1}, {"id": "b"}]')
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "get", fake_get)
+
+        df = client.get_all_datasets()
+
+        assert list(df.columns)[:2] == ["id", "created_by"]
+        assert "extra" not in df.columns
+        assert "n_images" in df.columns
+        assert list(df["id"]) == ["a", "b"]
+        assert df["status"].isna().tolist() == [False, True]
+
+    def test_get_all_datasets_polars(self, monkeypatch):
+        """Test that the polars listing keeps only the selected fields."""
+        pytest.importorskip("polars")
+
+        def fake_get(url, **kwargs):
+            return _fake_response(content=b'[{"id": "a", "status": "READY", "extra": 1}, {"id": "b"}]')
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "get", fake_get)
+
+        df = client.get_all_datasets_polars()
+
+        assert df.columns[:2] == ["id", "created_by"]
+        assert "extra" not in df.columns
+        assert df["id"].to_list() == ["a", "b"]
+        assert df["status"].to_list() == ["READY", None]
+
+    def test_get_datasets_bulk(self, monkeypatch):
+        """Test that bulk details are combined into one DataFrame in input order."""
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(VisualLayerClient, "get_dataset_details", lambda self, dataset_id: {"id": dataset_id})
+
+        df = client.get_datasets_bulk([str(i) for i in range(10)], max_workers=4)
+
+        assert list(df["id"]) == [str(i) for i in range(10)]
+        assert client.get_datasets_bulk([]).empty
+
+    def test_generate_jwt_is_thread_safe(self, monkeypatch):
+        """Test that concurrent callers at expiry share a single re-sign."""
+        client = VisualLayerClient("test_key", "test_secret")
+        client._generate_jwt()
+        client._jwt_exp = 0
+        sign_jwt = client._sign_jwt
+        signed = []
+
+        def slow_sign_jwt():
+            signed.append(1)
+            # Hold the refresh open long enough for every other thread to see the expired token
+            time.sleep(0.05)
+            return sign_jwt()
+
+        monkeypatch.setattr(client, "_sign_jwt", slow_sign_jwt)
+        barrier = threading.Barrier(16)
+        tokens = []
+
+        def call():
+            barrier.wait()
+            tokens.append(client._generate_jwt())
+
+        threads = [threading.Thread(target=call) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(signed) == 1
+        assert len(tokens) == 16 and len(set(tokens)) == 1
+
+    def test_get_all_datasets_detailed(self, monkeypatch):
+        """Test that details are fetched for every listed dataset, in listing order."""
+        from src.visual_layer_sdk.dataset import Dataset
+
+        ids = [f"bc41491e-78ae-11ef-ba4b-8a774758b5{i:02d}" for i in range(20)]
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(VisualLayerClient, "iter_all_datasets", lambda self, page_size=None: iter([{"id": i} for i in ids]))
+        monkeypatch.setattr(Dataset, "get_details", lambda self: {"id": self.dataset_id})
+
+        assert client.get_all_datasets_detailed(max_workers=4) == [{"id": i} for i in ids]
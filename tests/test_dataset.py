@@ -0,0 +1,204 @@
+"""Tests for the Dataset class."""
+
+import io
+import json
+
+import pytest
+import requests
+
+from src.visual_layer_sdk.client import VisualLayerClient
+from src.visual_layer_sdk.dataset import Dataset
+
+
+def _fake_response(status_code: int = 200, content: bytes = None, raw=None, headers: dict = None) -> requests.Response:
+    """Build a requests.Response with either a preloaded body or a raw stream"""
+    response = requests.Response()
+    response.status_code = status_code
+    if content is not None:
+        response._content = content
+    if raw is not None:
+        response.raw = raw
+    if headers:
+        response.headers.update(headers)
+    return response
+
+
+class TestDataset:
+    """Test cases for Dataset."""
+
+    def test_dataset_initialization(self):
+        """Test that the dataset keeps a reference to its client."""
+        client = VisualLayerClient("test_key", "test_secret")
+        dataset = Dataset(client, "bc41491e-78ae-11ef-ba4b-8a774758b536")
+
+        assert dataset.client is client
+        assert dataset.dataset_id == "bc41491e-78ae-11ef-ba4b-8a774758b536"
+
+    def test_dataset_uses_slots(self):
+        """Test that Dataset instances do not carry a per-instance __dict__."""
+        client = VisualLayerClient("test_key", "test_secret")
+        dataset = Dataset(client, "bc41491e-78ae-11ef-ba4b-8a774758b536")
+
+        assert not hasattr(dataset, "__dict__")
+        with pytest.raises(AttributeError):
+            dataset.base_url = client.base_url
+
+    def test_dataset_urls(self):
+        """Test that per-dataset URLs are built from the client's base URL."""
+        client = VisualLayerClient("test_key", "test_secret")
+        dataset = Dataset(client, "bc41491e-78ae-11ef-ba4b-8a774758b536")
+
+        assert dataset._url == f"{client.base_url}/dataset/bc41491e-78ae-11ef-ba4b-8a774758b536"
+        assert dataset._stats_url == f"{client.base_url}/dataset/bc41491e-78ae-11ef-ba4b-8a774758b536/stats"
+        assert dataset._explore_url == f"{client.base_url}/explore/bc41491e-78ae-11ef-ba4b-8a774758b536"
+
+    def test_fetch_all_caches_results(self, monkeypatch):
+        """Test that fetch_all fetches each field once and serves repeats from the cache."""
+        calls = []
+        monkeypatch.setattr(Dataset, "_fetch_details", lambda self: calls.append("details") or {"status": "READY"})
+        monkeypatch.setattr(Dataset, "get_stats", lambda self: calls.append("stats") or {"n_images": 3})
+        client = VisualLayerClient("test_key", "test_secret")
+        dataset = Dataset(client, "bc41491e-78ae-11ef-ba4b-8a774758b536")
+
+        first = dataset.fetch_all(fields=("details", "stats"))
+        second = dataset.fetch_all(fields=("details", "stats"))
+
+        assert first == second == {"details": {"status": "READY"}, "stats": {"n_images": 3}}
+        assert sorted(calls) == ["details", "stats"]
+
+        dataset.invalidate()
+        dataset.fetch_all(fields=("details",))
+        assert sorted(calls) == ["details", "details", "stats"]
+
+    def test_fetch_all_rejects_unknown_fields(self):
+        """Test that unknown field names are rejected."""
+        client = VisualLayerClient("test_key", "test_secret")
+        dataset = Dataset(client, "bc41491e-78ae-11ef-ba4b-8a774758b536")
+
+        with pytest.raises(ValueError):
+            dataset.fetch_all(fields=("details", "bogus"))
+
+    def test_dataset_id_is_normalized(self):
+        """Test that dataset IDs are stored in canonical UUID form."""
+        client = VisualLayerClient("test_key", "test_secret")
+        dataset = Dataset(client, "BC41491E-78AE-11EF-BA4B-8A774758B536")
+
+        assert dataset.dataset_id == "bc41491e-78ae-11ef-ba4b-8a774758b536"
+
+    def test_invalid_dataset_id(self):
+        """Test that malformed dataset IDs are rejected."""
+        client = VisualLayerClient("test_key", "test_secret")
+
+        with pytest.raises(ValueError, match="Invalid dataset_id"):
+            Dataset(client, "not-a-uuid")
+        with pytest.raises(ValueError, match="Invalid dataset_id"):
+            Dataset(client, None)
+
+    @pytest.mark.parametrize("use_ijson", [True, False])
+    def test_export_to_dataframe(self, monkeypatch, use_ijson):
+        """Test that media_items are exported without their metadata_items."""
+        from src.visual_layer_sdk import dataset as dataset_module
+
+        if use_ijson:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(dataset_module, "ijson", None)
+
+        body = b'{"media_items": [{"id": "a", "metadata_items": [{"type": "caption"}]}, {"id": "b", "metadata_items": []}]}'
+
+        def fake_get(url, **kwargs):
+            return _fake_response(raw=io.BytesIO(body))
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "get", fake_get)
+        monkeypatch.setattr(Dataset, "get_status", lambda self: "READY")
+        dataset = Dataset(client, "bc41491e-78ae-11ef-ba4b-8a774758b536")
+
+        df = dataset.export_to_dataframe()
+
+        assert list(df.columns) == ["id"]
+        assert list(df["id"]) == ["a", "b"]
+
+    @pytest.mark.parametrize(
+        "content_type, body",
+        [
+            ("application/x-ndjson", b'{"id": "a", "metadata_items": []}\n{"id": "b", "metadata_items": []}\n'),
+            ("application/json", b'{"media_items": [{"id": "a", "metadata_items": []}, {"id": "b", "metadata_items": []}]}'),
+        ],
+    )
+    def test_export_to_dataframe_fast(self, monkeypatch, content_type, body):
+        """Test that NDJSON exports are read directly and JSON responses fall back cleanly."""
+
+        def fake_get(url, **kwargs):
+            assert kwargs["params"] == {"export_format": "jsonl"}
+            return _fake_response(headers={"Content-Type": content_type}, raw=io.BytesIO(body))
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "get", fake_get)
+        monkeypatch.setattr(Dataset, "get_status", lambda self: "READY")
+        dataset = Dataset(client, "bc41491e-78ae-11ef-ba4b-8a774758b536")
+
+        df = dataset.export_to_dataframe_fast()
+
+        assert list(df.columns) == ["id"]
+        assert list(df["id"]) == ["a", "b"]
+
+    def test_request_export_closes_failed_stream(self, monkeypatch):
+        """Test that a failed streamed export releases its connection before raising."""
+        raw = io.BytesIO(b'{"message": "boom"}')
+
+        def fake_get(url, **kwargs):
+            return _fake_response(status_code=500, raw=raw)
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "get", fake_get)
+        dataset = Dataset(client, "bc41491e-78ae-11ef-ba4b-8a774758b536")
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            dataset._request_export(stream=True)
+        assert raw.closed
+
+    def test_get_details_is_cached(self, monkeypatch):
+        """Test that get_status and get_details share one cached details request."""
+        calls = []
+        monkeypatch.setattr(Dataset, "_fetch_details", lambda self: calls.append(1) or {"status": "READY"})
+        client = VisualLayerClient("test_key", "test_secret")
+        dataset = Dataset(client, "bc41491e-78ae-11ef-ba4b-8a774758b536")
+
+        assert dataset.get_status() == "READY"
+        assert dataset.get_details() == {"status": "READY"}
+        assert len(calls) == 1
+
+        dataset.get_details(ttl=0)
+        assert len(calls) == 2
+
+        dataset.invalidate()
+        dataset.get_status()
+        assert len(calls) == 3
+
+    @pytest.mark.parametrize("method", ["search_by_labels", "search_by_labels_batched"])
+    def test_search_by_labels(self, monkeypatch, method):
+        """Test that label search pages clusters and previews and drops duplicate images."""
+        cluster_pages = [[{"cluster_id": "c1"}, {"cluster_id": "c2"}], [{"cluster_id": "c1"}], []]
+        preview_pages = {
+            "c1": [[{"image_id": "i1", "labels": ["cat"]}, {"image_id": "i2", "labels": ["cat", "dog"]}], []],
+            "c2": [[{"image_id": "i2", "labels": ["dog"]}, {"image_id": "i3", "labels": []}], []],
+        }
+
+        def fake_get(url, params=None, **kwargs):
+            assert params["labels"] == '["cat","dog"]'
+            if "/similarity_cluster/" in url:
+                body = {"previews": preview_pages[url.rsplit("/", 1)[-1]][params["page_number"]]}
+            else:
+                body = {"clusters": cluster_pages[params["page_number"]]}
+            return _fake_response(content=json.dumps(body).encode())
+
+        client = VisualLayerClient("test_key", "test_secret")
+        monkeypatch.setattr(client.session, "get", fake_get)
+        dataset = Dataset(client, "bc41491e-78ae-11ef-ba4b-8a774758b536")
+
+        df = getattr(dataset, method)(["cat", "dog"])
+
+        assert list(df["image_id"]) == ["i1", "i2", "i3"]
+        assert list(df["cluster_id"]) == ["c1", "c1", "c2"]
+        assert list(df["labels"]) == ["cat", "cat, dog", ""]
@@ -0,0 +1,41 @@
+"""Tests for the JSON helpers."""
+
+import pytest
+import requests
+
+from src.visual_layer_sdk import json_utils
+
+
+class TestJsonUtils:
+    """Test cases for json_utils."""
+
+    def test_loads_bytes_and_str(self):
+        """Test that both bytes and str bodies are parsed."""
+        assert json_utils.loads(b'{"id": 1, "labels": ["cat"]}') == {"id": 1, "labels": ["cat"]}
+        assert json_utils.loads("[1, 2, 3]") == [1, 2, 3]
+
+    def test_loads_without_orjson(self, monkeypatch):
+        """Test that the stdlib json module is used when orjson is unavailable."""
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+        assert json_utils.loads(b'{"status": "READY"}') == {"status": "READY"}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_response_json_rejects_html(self, monkeypatch, use_orjson):
+        """Test that a non-JSON body raises the same exception type as response.json()."""
+        if not use_orjson:
+            monkeypatch.setattr(json_utils, "orjson", None)
+        response = requests.Response()
+        response.status_code = 502
+        response._content = b"<html><body>Bad Gateway</body></html>"
+
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            json_utils.response_json(response)
+
+    def test_dumps_is_compact(self, monkeypatch):
+        """Test that dumps produces the same compact output with and without orjson."""
+        expected = '["bean_rust","angular_leaf_spot"]'
+        assert json_utils.dumps(["bean_rust", "angular_leaf_spot"]) == expected
+
+        monkeypatch.setattr(json_utils, "orjson", None)
+        assert json_utils.dumps(["bean_rust", "angular_leaf_spot"]) == expected